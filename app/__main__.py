@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import functools
 import json
 import logging
 import os
@@ -11,13 +12,60 @@ import argcomplete
 from argparse import RawTextHelpFormatter
 from datetime import datetime, timezone
 from app import __version__
-from .utils import cleanup, common, engines, self_update
-from .utils.registries import get_image_tags
-from .utils.common import setup_logging
-from .utils.config import config, create_example_config
-from .utils.scripts import execute_pre_script, execute_post_script, should_continue_on_pre_failure, should_rollback_on_post_failure
-from .utils.notifiers import notification_manager
-from .utils.interrupt import install_interrupt_handlers
+
+# Note: The application modules (configuration, Docker engine, registries, notifiers, scripts)
+# load the configuration file and pull in the docker/requests stack. They are therefore imported
+# inside the functions using them, which keeps "--version", "--help" and shell auto-completion fast.
+
+
+# Valid values for auto-completion and validation (tuples keep the display order,
+# the frozenset provides O(1) membership checks)
+CONTAINER_STATUSES = ("running", "exited", "created", "paused", "restarting", "removing", "dead", "all")
+LOG_LEVELS = ("debug", "info", "warning", "error", "critical")
+LOG_LEVEL_SET = frozenset(LOG_LEVELS)
+
+# Additional explanation appended to the log message of a rejected update, by reject reason
+_REJECT_REASON_DETAILS = {
+    "General": " {update_type} updates are generally not allowed",
+    "MinImageAge": " Image age is too recent",
+    "Conditions": " Required conditions have not been satisfied",
+    "LagPolicy": " Version is too recent",
+}
+
+# Short-lived cache for container names used by --filter auto-completion (see complete_filter)
+# XDG_CACHE_HOME is ignored unless it is an absolute path, as required by the XDG base directory spec
+_xdg_cache_home = os.environ.get("XDG_CACHE_HOME", "")
+CONTAINER_NAMES_CACHE_PATH = os.path.join(
+    _xdg_cache_home if os.path.isabs(_xdg_cache_home) else os.path.join(os.path.expanduser("~"), ".cache"),
+    "captn",
+    "containers.json",
+)
+CONTAINER_NAMES_CACHE_TTL = 5  # seconds
+
+# Static help texts are built once at import time instead of on every parse_args() call
+_DESCRIPTION = (
+    "A rule-driven container updater that automates container updates based on semantic versioning and registry metadata."
+)
+_FILTER_HELP = textwrap.dedent("""
+                            Filter the list of containers to process.
+
+                            Supported filter expressions:
+                            name=<container_name>       Match container names. If wildcards (*, ?) are used,
+                                                        pattern matching is applied. If no wildcards are given,
+                                                        exact name matching is enforced. You can specify
+                                                        multiple name filters.
+
+                            status=<status>             Filter by container status. Supported values:
+                                                        running, exited, created, paused, restarting,
+                                                        removing, dead, or all.
+
+                            Examples:
+                            --filter name=nginx name=redis
+                            --filter name=ngin* name=*cloud* name=cloud-0?
+                            --filter status=running
+                            --filter name=webapp status=all
+
+                        """)
 
 
 def get_container_names():
@@ -27,19 +75,71 @@ def get_container_names():
     This function retrieves all Docker containers (running and stopped) and returns
     their names for use in command-line argument completion.
 
+    To keep tab completion responsive, the Docker API is only queried when the
+    current completion line actually completes a name filter, and the result is
+    cached on disk for a few seconds so repeated Tab presses only need to read
+    the cache file.
+
     Returns:
         list: List of container names, or empty list if Docker client is unavailable
     """
+    comp_line = os.environ.get("COMP_LINE")
+    if comp_line is not None and "name=" not in comp_line:
+        return []
+
+    try:
+        if time.time() - os.stat(CONTAINER_NAMES_CACHE_PATH).st_mtime < CONTAINER_NAMES_CACHE_TTL:
+            with open(CONTAINER_NAMES_CACHE_PATH, "r") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
     try:
-        client = engines.get_client()
+        from .utils import engines
+
+        # Connection problems must not print log messages into the user's shell while completing
+        logging.disable(logging.CRITICAL)
+        try:
+            client = engines.get_client()
+        finally:
+            logging.disable(logging.NOTSET)
         if client:
-            containers = client.containers.list(all=True)
-            return [container.name for container in containers]
+            # The low-level API returns the names without inspecting every container
+            container_names = [container["Names"][0].lstrip("/") for container in client.api.containers(all=True)]
+            try:
+                os.makedirs(os.path.dirname(CONTAINER_NAMES_CACHE_PATH), exist_ok=True)
+                tmp_path = f"{CONTAINER_NAMES_CACHE_PATH}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(container_names, f)
+                os.replace(tmp_path, CONTAINER_NAMES_CACHE_PATH)
+            except OSError:
+                pass
+            return container_names
     except Exception:
         pass
     return []
 
 
+def complete_filter(prefix, **kwargs):
+    """
+    Complete values of the --filter argument for argcomplete.
+
+    Offers the supported filter keys first and, once a key has been typed, the
+    matching container names or statuses.
+
+    Parameters:
+        prefix (str): The part of the filter expression typed so far
+
+    Returns:
+        list: Filter expressions to offer for completion
+    """
+    if prefix.startswith("name="):
+        return [f"name={name}" for name in get_container_names()]
+    if prefix.startswith("status="):
+        return [f"status={status}" for status in get_container_statuses()]
+    return ["name=", "status="]
+
+
 def get_container_statuses():
     """
     Get list of valid container statuses for auto-completion.
@@ -48,9 +148,9 @@ def get_container_statuses():
     for filtering containers in the command-line interface.
 
     Returns:
-        list: List of valid container status strings
+        tuple: Shared, immutable tuple of valid container status strings
     """
-    return ["running", "exited", "created", "paused", "restarting", "removing", "dead", "all"]
+    return CONTAINER_STATUSES
 
 
 def get_log_levels():
@@ -61,9 +161,42 @@ def get_log_levels():
     in the command-line interface for setting the application's log verbosity.
 
     Returns:
-        list: List of valid log level strings
+        tuple: Shared, immutable tuple of valid log level strings
+    """
+    return LOG_LEVELS
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(ts: str) -> datetime:
+    """
+    Parse an ISO 8601 registry timestamp into a timezone-aware datetime.
+
+    Tag lists are shared between containers running the same image, so parsed
+    timestamps are cached.
+
+    Parameters:
+        ts (str): ISO 8601 timestamp as reported by the registry (e.g. "2024-01-01T12:00:00.000000Z")
+
+    Returns:
+        datetime: Parsed timestamp (naive timestamps are treated as UTC)
+    """
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _age_minutes(ts: str) -> int:
+    """
+    Calculate the age of a registry timestamp in minutes.
+
+    Parameters:
+        ts (str): ISO 8601 timestamp as reported by the registry (e.g. "2024-01-01T12:00:00.000000Z")
+
+    Returns:
+        int: Number of full minutes elapsed since the timestamp
     """
-    return ["debug", "info", "warning", "error", "critical"]
+    return int((datetime.now(timezone.utc) - _parse_timestamp(ts)).total_seconds() / 60)
 
 
 def clear_logs():
@@ -77,39 +210,33 @@ def clear_logs():
     The function handles both regular log files and their rotated versions,
     as well as container comparison files created during update verification.
     """
-    import glob
-    import os
-
     log_dir = os.path.join(os.path.dirname(__file__), "logs")
     if os.path.exists(log_dir):
-        deleted_count = 0
-
-        # Find all log files (captn.log, captn.log.1, captn.log.2, etc.)
-        log_pattern = os.path.join(log_dir, "captn.log*")
-        log_files = glob.glob(log_pattern)
-
-        for log_file in log_files:
-            try:
-                os.remove(log_file)
-                deleted_count += 1
-                logging.info(f"Deleted log file: {os.path.basename(log_file)}")
-            except Exception as e:
-                logging.error(f"Failed to delete log file {log_file}: {e}")
-
-        # Find all comparison files (container_comparison_*.json)
-        comparison_pattern = os.path.join(log_dir, "container_comparison_*.json")
-        comparison_files = glob.glob(comparison_pattern)
+        deleted_files = []
+
+        # Collect log files (captn.log, captn.log.1, ...) and comparison files
+        # (container_comparison_*.json) in a single directory pass
+        with os.scandir(log_dir) as entries:
+            targets = [
+                entry for entry in entries
+                if entry.is_file()
+                and (
+                    entry.name.startswith("captn.log")
+                    or (entry.name.startswith("container_comparison_") and entry.name.endswith(".json"))
+                )
+            ]
 
-        for comparison_file in comparison_files:
+        for entry in targets:
+            file_kind = "log" if entry.name.startswith("captn.log") else "comparison"
             try:
-                os.remove(comparison_file)
-                deleted_count += 1
-                logging.info(f"Deleted comparison file: {os.path.basename(comparison_file)}")
+                os.unlink(entry.path)
+                deleted_files.append(f"Deleted {file_kind} file: {entry.name}")
             except Exception as e:
-                logging.error(f"Failed to delete comparison file {comparison_file}: {e}")
+                logging.error(f"Failed to delete {file_kind} file {entry.path}: {e}")
 
-        if deleted_count > 0:
-            logging.info(f"Successfully deleted {deleted_count} file(s)")
+        if deleted_files:
+            logging.info("\n".join(deleted_files))
+            logging.info(f"Successfully deleted {len(deleted_files)} file(s)")
         else:
             logging.info("No log or comparison files found to delete")
     else:
@@ -129,9 +256,7 @@ def parse_args():
     """
     parser = argparse.ArgumentParser(
         prog="captn.io/captn",
-        description=(
-            "A rule-driven container updater that automates container updates based on semantic versioning and registry metadata."
-        ),
+        description=_DESCRIPTION,
         formatter_class=RawTextHelpFormatter,
     )
 
@@ -153,35 +278,13 @@ def parse_args():
     )
     filter_arg = parser.add_argument(
         "--filter", nargs="*", metavar="FILTER",
-        help=textwrap.dedent("""
-                            Filter the list of containers to process.
-
-                            Supported filter expressions:
-                            name=<container_name>       Match container names. If wildcards (*, ?) are used,
-                                                        pattern matching is applied. If no wildcards are given,
-                                                        exact name matching is enforced. You can specify
-                                                        multiple name filters.
-
-                            status=<status>             Filter by container status. Supported values:
-                                                        running, exited, created, paused, restarting,
-                                                        removing, dead, or all.
-
-                            Examples:
-                            --filter name=nginx name=redis
-                            --filter name=ngin* name=*cloud* name=cloud-0?
-                            --filter status=running
-                            --filter name=webapp status=all
-
-                        """)
+        help=_FILTER_HELP,
     )
+    filter_arg.completer = complete_filter
     parser.add_argument(
         "--log-level", "-l",
-        choices=["debug", "info", "warning", "error", "critical"],
-        default=(
-            config.logging.level.lower()
-            if config.logging.level.lower() in ["debug", "info", "warning", "error", "critical"]
-            else "info"
-        ),
+        choices=LOG_LEVELS,
+        default=None,  # Resolved from the configuration in main()
         help="Set the logging level",
     )
     parser.add_argument(
@@ -201,6 +304,332 @@ def parse_args():
     return parser.parse_args()
 
 
+def process_container(client, container, dry_run: bool):
+    """
+    Check a single container for image updates and apply the permitted ones.
+
+    This covers the complete per-container workflow: rule pre-check, container and
+    image inspection, remote tag lookup, update type and permit evaluation, image
+    pull, pre-scripts and container recreation. Results are recorded in the global
+    notification manager. Self-updates are not executed here but returned to the
+    caller so they can be performed at the very end of the update cycle.
+
+    Parameters:
+        client: Docker client instance
+        container: Docker container object to process
+        dry_run (bool): If True, only simulate the updates
+
+    Returns:
+        dict: Self-update information (container, new_image_reference, update_type)
+              if a self-update has been scheduled, otherwise None
+    """
+    from .utils import common, engines
+    from .utils.config import config
+    from .utils.notifiers import notification_manager
+    from .utils.registries import get_image_tags
+    from .utils.scripts import execute_pre_script, should_continue_on_pre_failure
+
+    self_update_info = None
+    counted = False
+    logging.info("Processing container '%s'", container.name, extra={"indent": 0})
+
+    def skip_container(rule_name):
+        """Report the container as skipped, as its assigned rule does not allow any updates."""
+        logging.info(
+            "Skipping container '%s' - Assigned rule '%s' does not allow any updates",
+            container.name,
+            rule_name,
+            extra={"indent": 2},
+        )
+        notification_manager.add_skip_detail(
+            container.name,
+            f"Assigned rule '{rule_name}' does not allow any updates",
+        )
+
+    # Rule pre-check: Determine if the container has any allowed update types. Unless an image based
+    # rule assignment may apply, this only depends on the container name, so containers whose rule
+    # does not allow any updates are skipped before their image is inspected or the registry is queried.
+    allowed_types, effective_rule, rule_name_original = common.get_container_allowed_update_types(container_name=container.name)
+    check_image_rule = common.may_assign_rule_by_image(container.name)
+    if not allowed_types and not check_image_rule:
+        skip_container(effective_rule)
+        return None
+
+    try:
+        container_inspect_data = container.attrs  # containers.list() already returns the inspect data
+        image = engines.get_image(client, container_inspect_data.get("Image"))
+        image_metadata = engines.get_local_image_metadata(image, container_inspect_data)
+        if not image_metadata:
+            if not allowed_types:
+                # The image based assignment cannot be evaluated, so the name based decision applies
+                skip_container(effective_rule)
+                return None
+            notification_manager.increment_processed()
+            logging.error("Failed to get image metadata for container '%s'", container.name, extra={"indent": 2})
+            return None
+        image_inspect_data = image.attrs  # images.get() already returns the inspect data
+
+        if check_image_rule:
+            allowed_types, effective_rule, rule_name_original = common.get_container_allowed_update_types(
+                container_name=container.name,
+                image_reference=image_metadata.get("reference"),
+            )
+            if not allowed_types:
+                skip_container(effective_rule)
+                return None
+
+        notification_manager.increment_processed()
+        counted = True
+
+        # Tag the container was created with (a colon inside a registry host:port is not a tag separator)
+        _, separator, configured_tag = container_inspect_data["Config"]["Image"].rpartition(":")
+        current_image_tag = configured_tag if separator and "/" not in configured_tag else None
+
+        remote_image_tags = get_image_tags(
+            imageName=image_metadata["name"],
+            imageUrl=image_metadata["imageUrl"],
+            registry=image_metadata["registry"],
+            imageTagsUrl=image_metadata["imageTagsUrl"],
+            imageTag=current_image_tag,
+        )
+    except Exception as e:
+        if not counted:
+            if not allowed_types:
+                # Failed while inspecting the image for an image based assignment, the name based decision applies
+                skip_container(effective_rule)
+                return None
+            notification_manager.increment_processed()
+        error_msg = f"Failed to inspect container '{container.name}': {e}"
+        logging.error(error_msg, extra={"indent": 2})
+        notification_manager.add_update_detail(
+            container_name=container.name,
+            old_version="Unknown",
+            new_version="Unknown",
+            update_type="unknown",
+            status="failed",
+            error_message=error_msg,
+        )
+        return None
+
+    # Debug logging with conditional formatting (skip serialization unless DEBUG is enabled)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"-> container_inspect_data:  \n{json.dumps(container_inspect_data, indent=4) if container_inspect_data   else None}", extra={"indent": 2})
+        logging.debug(f"-> image_inspect_data:      \n{json.dumps(image_inspect_data, indent=4)     if image_inspect_data       else None}", extra={"indent": 2})
+        logging.debug(f"-> image_metadata:          \n{json.dumps(image_metadata, indent=4)         if image_metadata           else None}", extra={"indent": 2})
+        logging.debug(f"-> remote_image_tags:       \n{json.dumps(remote_image_tags, indent=4)      if remote_image_tags        else None}", extra={"indent": 2})
+
+    if (container and container_inspect_data and image and image_metadata and image_inspect_data and remote_image_tags):
+        virtual_image_metadata = image_metadata.copy() if dry_run else None
+        latest_version = remote_image_tags[0].get("name")
+        last_index = len(remote_image_tags) - 1
+        for i, remote_image_tag in enumerate(reversed(remote_image_tags)):
+            # Currently deployed tag (simulated in dry-run mode, refreshed after each recreation)
+            current_tag = (virtual_image_metadata or image_metadata or {}).get("tag")
+            remote_tag_name = remote_image_tag.get("name")
+            update_type = common.get_update_type(
+                old_version=current_tag,
+                new_version=remote_tag_name,
+                local_digests=image_inspect_data.get("RepoDigests"),
+                remote_digest=remote_image_tag.get("digest"),
+            )
+            logging.debug("-> update_type: %s", update_type, extra={"indent": 6})
+
+            if not update_type and i == last_index:
+                logging.info("No relevant image updates available for container '%s'", container.name, extra={"indent": 2})
+
+            if update_type not in ["unknown", None]:
+                update_permit, effective_rule, rule_name_original, update_reject_reason, new_image_reference = common.get_update_permit(
+                    container_name=container.name,
+                    image_reference=image_metadata.get("reference") if image_metadata else None,
+                    update_type=update_type,
+                    age=_age_minutes(ts) if (ts := remote_image_tag.get("last_updated")) else None,
+                    old_version=current_tag,
+                    new_version=remote_tag_name,
+                    latest_version=latest_version,
+                    pre_check=False,
+                )
+
+                rule_cfg = common.parse_rule(config.rules._values.get(effective_rule, "{}"))
+
+                if effective_rule != rule_name_original:
+                    logging.warning(
+                        "Assigned rule '%s' not found for container '%s', fallback to 'default'",
+                        rule_name_original,
+                        container.name,
+                        extra={"indent": 2},
+                    )
+
+                log_tag_info = (
+                    f"{current_tag} -> {remote_tag_name}" if update_type != "digest"
+                    else f"{current_tag}"
+                )
+
+                if update_permit:
+                    log_action = "Would process" if dry_run else "Processing"
+                    logging.info(
+                        "%s %s update for '%s' (%s) allowed by rule '%s'",
+                        log_action,
+                        update_type,
+                        container.name,
+                        log_tag_info,
+                        effective_rule,
+                        extra={"indent": 2},
+                    )
+
+                    # Start timing for this update
+                    update_start_time = time.time()
+                    new_tag = remote_tag_name if remote_image_tag else "Unknown"
+
+                    def record_update(container_name, old_version, error_message=None):
+                        """Add the outcome of the current update to the notification statistics."""
+                        notification_manager.add_update_detail(
+                            container_name=container_name,
+                            old_version=old_version,
+                            new_version=new_tag,
+                            update_type=update_type,
+                            duration=time.time() - update_start_time,
+                            status="failed" if error_message else "succeeded",
+                            error_message=error_message,
+                        )
+
+                    # 1. Fetch new image
+                    new_image = engines.pull_image(client, new_image_reference, dry_run)
+                    if not new_image and not dry_run:
+                        continue
+
+                    # 2. Run Pre-Scripts
+                    pre_success, pre_output = execute_pre_script(
+                        container.name,
+                        dry_run,
+                        update_type=update_type,
+                        old_version=current_tag,
+                        new_version=remote_tag_name,
+                    )
+                    if not pre_success and not should_continue_on_pre_failure():
+                        error_msg = f"Pre-script failed for container '{container.name}'"
+                        logging.error(error_msg, extra={"indent": 4})
+                        record_update(container.name, current_tag, error_msg)
+                        continue
+
+                    # 3. Recreate container
+                    if engines.is_self_container(container.name, container.id):
+                        # Prepare update info for potential failure tracking
+                        current_tag = image_metadata.get("tag") if image_metadata else "Unknown"
+
+                        # Self-Update: Handle self-update if this is the self container
+                        logging.info(
+                            "Self-update detected for container '%s' - scheduling for end of update cycle",
+                            container.name,
+                            extra={"indent": 4},
+                        )
+
+                        # Store the update info for later processing
+                        self_update_info = {
+                            "container": container,
+                            "new_image_reference": new_image_reference,
+                            "update_type": update_type,
+                        }
+
+                        # Self-Update: Currently we just assume that a self update will succeed because the helper container does not have access to the configuration and is not able to send messages
+                        record_update(container.name, current_tag)
+
+                        logging.debug(
+                            "Progressive updates are not supported for self-updates - skipping remaining updates for actual execution",
+                            extra={"indent": 4},
+                        )
+                        break
+                    else:
+                        new_container, recreate_error = engines.recreate_container(client, container, new_image_reference, container_inspect_data, dry_run, image_inspect_data, notification_manager, update_type=update_type, old_version=current_tag, new_version=new_tag)
+                        if new_container:
+                            try:
+                                # Refresh container and used image information
+                                container = new_container
+                                container_inspect_data = client.api.inspect_container(container.id)
+                                image = engines.get_image(client, container_inspect_data.get("Image"))
+                                image_metadata = engines.get_local_image_metadata(image, container_inspect_data)
+                                image_inspect_data = image.attrs
+
+                                # In dry-run mode, update the virtual image tag to simulate a successful update and ensure accurate logging
+                                if dry_run and virtual_image_metadata:
+                                    virtual_image_metadata["tag"] = remote_tag_name
+
+                                logging.info(
+                                    "%s container '%s' with updated image '%s'",
+                                    "Would have recreated" if dry_run else "Successfully recreated",
+                                    new_container.name,
+                                    new_image_reference,
+                                    extra={"indent": 4},
+                                )
+
+                                # Add successful update to notification statistics
+                                record_update(new_container.name, current_tag)
+
+                            except Exception as e:
+                                error_msg = f"Update failed for container '{new_container.name}': {e}"
+                                logging.error(error_msg, extra={"indent": 4})
+                                record_update(new_container.name, current_tag, error_msg)
+                        else:
+                            error_msg = recreate_error or f"Failed to recreate container '{container.name}'"
+                            logging.error(error_msg, extra={"indent": 4})
+                            record_update(container.name, current_tag, error_msg)
+
+                    # 4. Wait for some seconds
+                    if (config.update.delayBetweenUpdates and i < last_index and rule_cfg.get("progressiveUpgrade", True)):
+                        delay_s = common.parse_duration(config.update.delayBetweenUpdates, "s")
+                        logging.info("Waiting %s second%s before processing the next update for the same container", delay_s, "s" if delay_s != 1 else "", extra={"indent": 4})
+                        if not dry_run:
+                            time.sleep(delay_s)
+
+                    if (not rule_cfg.get("progressiveUpgrade", True) and i < last_index):
+                        logging.info("Progressive update disabled by rule '%s' - skipping remaining updates for actual execution", effective_rule, extra={"indent": 4})
+                        break
+                else:
+                    update_type_label = update_type.capitalize() if update_type else "Unknown"
+                    reject_detail = _REJECT_REASON_DETAILS.get(update_reject_reason, "").format(update_type=update_type_label)
+                    logging.info(
+                        "%s update for '%s' (%s) has been prevented by rule '%s' (Reason: [%s]%s)",
+                        update_type_label,
+                        container.name,
+                        log_tag_info,
+                        effective_rule,
+                        update_reject_reason,
+                        reject_detail,
+                        extra={"indent": 2},
+                    )
+            elif not update_type:
+                pass
+            else:
+                logging.warning("Unable to process update of type '%s' for container '%s'", update_type, container.name, extra={"indent": 2})
+
+    elif not remote_image_tags:
+        logging.info("No relevant image updates available for container '%s'", container.name, extra={"indent": 2})
+        notification_manager.add_skip_detail(
+            container.name,
+            "No relevant image tags available from registry",
+        )
+    else:
+        error_msg = (
+            f"Missing required data for container '{container.name if container else 'UNKNOWN'}': "
+            f"{'container ' if not container else ''}"
+            f"{'inspect_data ' if not container_inspect_data else ''}"
+            f"{'image ' if not image else ''}"
+            f"{'image_metadata ' if not image_metadata else ''}"
+            f"{'image_inspect_data ' if not image_inspect_data else ''}"
+            f"{'remote_image_tags' if not remote_image_tags else ''}"
+        )
+        logging.error(error_msg, extra={"indent": 2})
+        notification_manager.add_update_detail(
+            container_name=container.name,
+            old_version=image_metadata.get("tag") if image_metadata else "Unknown",
+            new_version="Unknown",
+            update_type="unknown",
+            status="failed",
+            error_message=error_msg,
+        )
+
+    return self_update_info
+
+
 def main():
     """
     Main entry point for the captn application.
@@ -218,6 +647,17 @@ def main():
     """
     args = parse_args()
 
+    from concurrent.futures import ThreadPoolExecutor
+    from .utils import cleanup, engines, self_update
+    from .utils.common import setup_logging
+    from .utils.config import config, create_example_config
+    from .utils.interrupt import install_interrupt_handlers
+    from .utils.notifiers import notification_manager
+
+    # Default log level from the configuration (deferred so argument parsing does not load the config)
+    if args.log_level is None:
+        args.log_level = level if (level := config.logging.level.lower()) in LOG_LEVEL_SET else "info"
+
     # Create/update example config file if running in container environment
     # This ensures the example file is always available when config directory is mounted
     if os.path.exists("/app/conf"):
@@ -230,15 +670,15 @@ def main():
             logging.info("Running as self-update helper - skipping daemon mode", extra={"indent": 0})
             return
 
-        from .utils.scheduler import start_scheduler
+        from .utils.scheduler import start_scheduler, stop_scheduler
         import signal
-        import sys
+        import threading
+
+        shutdown_requested = threading.Event()
 
         def signal_handler(signum, frame):
             logging.info("Received shutdown signal, stopping scheduler...")
-            from .utils.scheduler import stop_scheduler
-            stop_scheduler()
-            sys.exit(0)
+            shutdown_requested.set()
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, signal_handler)
@@ -250,20 +690,13 @@ def main():
         # Start scheduler
         start_scheduler()
 
-        # Keep main thread alive
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logging.info("Received keyboard interrupt, shutting down...")
-            from .utils.scheduler import stop_scheduler
-            stop_scheduler()
+        # Keep main thread alive (blocks without periodic wake-ups until a shutdown signal arrives)
+        shutdown_requested.wait()
+        stop_scheduler()
         return
 
-    dry_run = (
-        False if args.run
-        else (True if args.dry_run else str(config.general.dryRun).lower() in ("yes", "true", "1"))
-    )
+    # general.dryRun is validated to be a boolean when the configuration is loaded
+    dry_run = not args.run and (args.dry_run or config.general.dryRun)
 
     # Clear logs if requested
     if args.clear_logs:
@@ -301,306 +734,29 @@ def main():
     notification_manager.reset_stats()
     notification_manager.set_start_time()
 
-    for container in containers:
-        logging.info(f"Processing container '{container.name}'", extra={"indent": 0})
-
-        # Rule pre-check: Determine if the container has any allowed update types
-        allowed_types, effective_rule, rule_name_original = common.get_container_allowed_update_types(
-            container_name=container.name,
-            image_reference=None,  # Will be determined later when we have the actual image data
-        )
-
-        if not allowed_types:
-            logging.info(
-                f"Skipping container '{container.name}' - Assigned rule '{effective_rule}' does not allow any updates",
-                extra={"indent": 2},
-            )
-            notification_manager.add_skip_detail(
-                container.name,
-                f"Assigned rule '{effective_rule}' does not allow any updates",
-            )
-            continue
-
-        notification_manager.increment_processed()
-
-        try:
-            container_inspect_data = client.api.inspect_container(container.id)
-            image = client.images.get(container_inspect_data.get("Image"))
-            image_metadata = engines.get_local_image_metadata(image, container_inspect_data)
-            if not image_metadata:
-                logging.error(f"Failed to get image metadata for container '{container.name}'", extra={"indent": 2})
-                continue
-            image_inspect_data = client.api.inspect_image(container_inspect_data.get("Image"))
-            remote_image_tags = get_image_tags(
-                imageName=image_metadata["name"],
-                imageUrl=image_metadata["imageUrl"],
-                registry=image_metadata["registry"],
-                imageTagsUrl=image_metadata["imageTagsUrl"],
-                imageTag=(
-                    container_inspect_data["Config"]["Image"].rsplit(":", 1)[1]
-                    if ":" in container_inspect_data["Config"]["Image"]
-                    else None
-                ),
-            )
-        except Exception as e:
-            error_msg = f"Failed to inspect container '{container.name}': {e}"
-            logging.error(error_msg, extra={"indent": 2})
-            notification_manager.add_update_detail(
-                container_name=container.name,
-                old_version="Unknown",
-                new_version="Unknown",
-                update_type="unknown",
-                status="failed",
-                error_message=error_msg,
-            )
-            continue
-
-        # Debug logging with conditional formatting
-        logging.debug(f"-> container_inspect_data:  \n{json.dumps(container_inspect_data, indent=4) if container_inspect_data   else None}", extra={"indent": 2})
-        logging.debug(f"-> image_inspect_data:      \n{json.dumps(image_inspect_data, indent=4)     if image_inspect_data       else None}", extra={"indent": 2})
-        logging.debug(f"-> image_metadata:          \n{json.dumps(image_metadata, indent=4)         if image_metadata           else None}", extra={"indent": 2})
-        logging.debug(f"-> remote_image_tags:       \n{json.dumps(remote_image_tags, indent=4)      if remote_image_tags        else None}", extra={"indent": 2})
-
-        if (container and container_inspect_data and image and image_metadata and image_inspect_data and remote_image_tags):
-            virtual_image_metadata = image_metadata.copy() if dry_run else None
-            for i, remote_image_tag in enumerate(reversed(remote_image_tags)):
-                update_type = common.get_update_type(
-                    old_version=(
-                        virtual_image_metadata.get("tag") if dry_run and virtual_image_metadata
-                        else image_metadata.get("tag") if image_metadata else None
-                    ),
-                    new_version=remote_image_tag.get("name"),
-                    local_digests=image_inspect_data.get("RepoDigests"),
-                    remote_digest=remote_image_tag.get("digest"),
-                )
-                logging.debug(f"-> update_type: {update_type}", extra={"indent": 6})
-
-                if not update_type and i == len(remote_image_tags) - 1:
-                    logging.info(f"No relevant image updates available for container '{container.name}'", extra={"indent": 2})
-
-                if update_type not in ["unknown", None]:
-                    update_permit, effective_rule, rule_name_original, update_reject_reason, new_image_reference = common.get_update_permit(
-                        container_name=container.name,
-                        image_reference=image_metadata.get("reference") if image_metadata else None,
-                        update_type=update_type,
-                        age=(
-                            int((datetime.now(timezone.utc) - datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)).total_seconds() / 60)
-                            if (ts := remote_image_tag.get("last_updated"))
-                            else None
-                        ),
-                        old_version=(
-                            virtual_image_metadata.get("tag") if dry_run and virtual_image_metadata
-                            else image_metadata.get("tag") if image_metadata else None
-                        ),
-                        new_version=remote_image_tag.get("name"),
-                        latest_version=remote_image_tags[0].get("name"),
-                        pre_check=False,
-                    )
-
-                    if effective_rule != rule_name_original:
-                        logging.warning(
-                            f"Assigned rule '{rule_name_original}' not found for container '{container.name}', fallback to 'default'",
-                            extra={"indent": 2},
-                        )
-
-                    current_tag = (
-                        virtual_image_metadata.get("tag") if dry_run and virtual_image_metadata
-                        else image_metadata.get("tag") if image_metadata else None
-                    )
-                    log_tag_info = (
-                        f"{current_tag} -> {remote_image_tag.get('name')}" if update_type != "digest"
-                        else f"{current_tag}"
-                    )
-
-                    if update_permit:
-                        log_action = "Would process" if dry_run else "Processing"
-                        logging.info(
-                            f"{log_action} {update_type} update for '{container.name}' ({log_tag_info}) allowed by rule '{effective_rule}'",
-                            extra={"indent": 2},
-                        )
-
-                        # Start timing for this update
-                        update_start_time = time.time()
-
-                        # 1. Fetch new image
-                        new_image = engines.pull_image(client, new_image_reference, dry_run)
-                        if not new_image and not dry_run:
-                            continue
-
-                        # 2. Run Pre-Scripts
-                        pre_success, pre_output = execute_pre_script(
-                            container.name,
-                            dry_run,
-                            update_type=update_type,
-                            old_version=current_tag,
-                            new_version=remote_image_tag.get("name"),
-                        )
-                        if not pre_success and not should_continue_on_pre_failure():
-                            error_msg = f"Pre-script failed for container '{container.name}'"
-                            logging.error(error_msg, extra={"indent": 4})
-                            new_tag = remote_image_tag.get("name") if remote_image_tag else "Unknown"
-                            update_duration = time.time() - update_start_time
-                            notification_manager.add_update_detail(
-                                container_name=container.name,
-                                old_version=current_tag,
-                                new_version=new_tag,
-                                update_type=update_type,
-                                duration=update_duration,
-                                status="failed",
-                                error_message=error_msg,
-                            )
-                            continue
-
-                        # 3. Recreate container
-                        if engines.is_self_container(container.name, container.id):
-                            # Prepare update info for potential failure tracking
-                            current_tag = image_metadata.get("tag") if image_metadata else "Unknown"
-                            new_tag = remote_image_tag.get("name") if remote_image_tag else "Unknown"
-
-                            # Self-Update: Handle self-update if this is the self container
-                            logging.info(
-                                f"Self-update detected for container '{container.name}' - scheduling for end of update cycle",
-                                extra={"indent": 4},
-                            )
-
-                            # Store the update info for later processing
-                            main.self_update_info = {
-                                "container": container,
-                                "new_image_reference": new_image_reference,
-                                "update_type": update_type,
-                            }
-
-                            # Self-Update: Currently we just assume that a self update will succeed because the helper container does not have access to the configuration and is not able to send messages
-                            update_duration = time.time() - update_start_time
-                            notification_manager.add_update_detail(
-                                container_name=container.name,
-                                old_version=current_tag,
-                                new_version=new_tag,
-                                update_type=update_type,
-                                duration=update_duration
-                            )
-
-                            logging.debug(
-                                "Progressive updates are not supported for self-updates - skipping remaining updates for actual execution",
-                                extra={"indent": 4},
-                            )
-                            break
-                        else:
-                            new_tag = remote_image_tag.get("name") if remote_image_tag else "Unknown"
-
-                            new_container, recreate_error = engines.recreate_container(client, container, new_image_reference, container_inspect_data, dry_run, image_inspect_data, notification_manager, update_type=update_type, old_version=current_tag, new_version=new_tag)
-                            if new_container:
-                                try:
-                                    # Refresh container and used image information
-                                    container = new_container
-                                    container_inspect_data = client.api.inspect_container(container.id)
-                                    image = client.images.get(container_inspect_data.get("Image"))
-                                    image_metadata = engines.get_local_image_metadata(image, container_inspect_data)
-                                    image_inspect_data = client.api.inspect_image(container_inspect_data.get("Image"))
-
-                                    # In dry-run mode, update the virtual image tag to simulate a successful update and ensure accurate logging
-                                    if dry_run and virtual_image_metadata:
-                                        virtual_image_metadata["tag"] = remote_image_tag.get("name")
-
-                                    logging.info(
-                                        f"{'Would have recreated' if dry_run else 'Successfully recreated'} container '{new_container.name}' with updated image '{new_image_reference}'",
-                                        extra={"indent": 4},
-                                    )
-
-                                    # Add successful update to notification statistics
-                                    update_duration = time.time() - update_start_time
-                                    notification_manager.add_update_detail(
-                                        container_name=new_container.name,
-                                        old_version=current_tag,
-                                        new_version=new_tag,
-                                        update_type=update_type,
-                                        duration=update_duration
-                                    )
-
-                                except Exception as e:
-                                    error_msg = f"Update failed for container '{new_container.name}': {e}"
-                                    logging.error(error_msg, extra={"indent": 4})
-                                    update_duration = time.time() - update_start_time
-                                    notification_manager.add_update_detail(
-                                        container_name=new_container.name,
-                                        old_version=current_tag,
-                                        new_version=new_tag,
-                                        update_type=update_type,
-                                        duration=update_duration,
-                                        status="failed",
-                                        error_message=error_msg,
-                                    )
-                            else:
-                                error_msg = recreate_error or f"Failed to recreate container '{container.name}'"
-                                logging.error(error_msg, extra={"indent": 4})
-                                update_duration = time.time() - update_start_time
-                                notification_manager.add_update_detail(
-                                    container_name=container.name,
-                                    old_version=current_tag,
-                                    new_version=new_tag,
-                                    update_type=update_type,
-                                    duration=update_duration,
-                                    status="failed",
-                                    error_message=error_msg,
-                                )
-
-                        # 4. Wait for some seconds
-                        if (config.update.delayBetweenUpdates and remote_image_tag != remote_image_tags[0] and json.loads(config.rules._values.get(effective_rule, "{}")).get("progressiveUpgrade", True)):
-                            delay_s = common.parse_duration(config.update.delayBetweenUpdates, "s")
-                            logging.info( f"Waiting {delay_s} second{'s' if delay_s != 1 else ''} before processing the next update for the same container", extra={"indent": 4}, )
-                            if not dry_run:
-                                time.sleep(delay_s)
-
-                        if (not json.loads(config.rules._values.get(effective_rule, "{}")).get("progressiveUpgrade", True) and i < len(remote_image_tags) - 1):
-                            logging.info( f"Progressive update disabled by rule '{effective_rule}' - skipping remaining updates for actual execution", extra={"indent": 4}, )
-                            break
-                    else:
-                        logging.info(
-                            f"{update_type.capitalize() if update_type else 'Unknown'} update for '{container.name}' ({log_tag_info}) has been prevented by rule '{effective_rule}' "
-                            f"(Reason: [{update_reject_reason}]"
-                            f"{' ' + (update_type.capitalize() if update_type else 'Unknown') + ' updates are generally not allowed' if update_reject_reason == 'General' else ''}"
-                            f"{' Image age is too recent' if update_reject_reason == 'MinImageAge' else ''}"
-                            f"{' Required conditions have not been satisfied' if update_reject_reason == 'Conditions' else ''}"
-                            f"{' Version is too recent' if update_reject_reason == 'LagPolicy' else ''})",
-                            extra={"indent": 2},
-                        )
-                elif not update_type:
-                    pass
-                else:
-                    logging.warning(f"Unable to process update of type '{update_type}' for container '{container.name}'", extra={"indent": 2})
+    max_workers = min(max(1, config.update.maxWorkers), len(containers))
+    if max_workers > 1:
+        # Containers are independent of each other, so their (mostly I/O bound) processing
+        # can run concurrently. Each container is still handled by exactly one worker.
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="captn-worker") as executor:
+            futures = [executor.submit(process_container, client, container, dry_run) for container in containers]
+            try:
+                results = [future.result() for future in futures]
+            except KeyboardInterrupt:
+                # Drop containers that have not been started yet, running workers stop at their next interrupt check
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+    else:
+        results = [process_container(client, container, dry_run) for container in containers]
 
-        elif not remote_image_tags:
-            logging.info(f"No relevant image updates available for container '{container.name}'", extra={"indent": 2})
-            notification_manager.add_skip_detail(
-                container.name,
-                "No relevant image tags available from registry",
-            )
-        else:
-            error_msg = (
-                f"Missing required data for container '{container.name if container else 'UNKNOWN'}': "
-                f"{'container ' if not container else ''}"
-                f"{'inspect_data ' if not container_inspect_data else ''}"
-                f"{'image ' if not image else ''}"
-                f"{'image_metadata ' if not image_metadata else ''}"
-                f"{'image_inspect_data ' if not image_inspect_data else ''}"
-                f"{'remote_image_tags' if not remote_image_tags else ''}"
-            )
-            logging.error(error_msg, extra={"indent": 2})
-            notification_manager.add_update_detail(
-                container_name=container.name,
-                old_version=image_metadata.get("tag") if image_metadata else "Unknown",
-                new_version="Unknown",
-                update_type="unknown",
-                status="failed",
-                error_message=error_msg,
-            )
+    self_update_info = next((result for result in results if result), None)
 
     # Handle self-updates at the very end to avoid interrupting other container updates
-    if hasattr(main, "self_update_info") and main.self_update_info:
-        container = main.self_update_info["container"]
-        new_image_reference = main.self_update_info["new_image_reference"]
+    if self_update_info:
+        container = self_update_info["container"]
+        new_image_reference = self_update_info["new_image_reference"]
 
-        logging.info(f"Processing self-update", extra={"indent": 0})
+        logging.info("Processing self-update", extra={"indent": 0})
 
         if not dry_run:
             self_update.trigger_self_update_from_producer(
@@ -613,7 +769,7 @@ def main():
             logging.info("Would trigger self-update via helper container", extra={"indent": 4})
 
     # Cleanup unused images and backup containers based on prune settings
-    if not hasattr(main, "self_update_info") or not main.self_update_info:
+    if not self_update_info:
         cleanup.perform_cleanup(client, dry_run)
     else:
         logging.info("Skipped cleanup because a self-update is pending", extra={"indent": 0})
@@ -2,11 +2,20 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from datetime import datetime
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 from .common import parse_duration
 from .config import config
 
+# Backup container suffix written by captn (<name>_bak_cu_YYYYmmdd-HHMMSS)
+_BACKUP_MARKER = "_bak_cu_"
+_BACKUP_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+_BACKUP_TIMESTAMP_PATTERN = re.compile(r"[0-9]{8}-[0-9]{6}")
+# Removals are independent requests to the daemon and are sent in parallel
+_MAX_REMOVAL_WORKERS = 8
+
 
 def cleanup_backup_containers(client, dry_run=False):
     """
@@ -31,29 +40,56 @@ def cleanup_backup_containers(client, dry_run=False):
     logging.info(f"{'Would check and remove' if dry_run else 'Checking and removing'} backup containers", extra={"indent": 2})
 
     removed_count = 0
+    expired_containers = []
     now = datetime.now()
 
+    def remove_backup_container(expired_container):
+        container_id, container_name = expired_container
+        try:
+            client.api.remove_container(container_id)
+            return True
+        except Exception as e:
+            logging.warning(f"Failed to remove backup container '{container_name}': {e}", extra={"indent": 4})
+            return False
+
     try:
-        for container in client.containers.list(all=True, filters={"status": "exited"}):
-            container_name = container.name
-            if "_bak_cu_" in container_name:
+        # The minimum age is the same for every backup container, so parse it only once
+        min_age_hours = parse_duration(config.prune.minBackupAge, "h")
+        # Zero-padded timestamps sort chronologically, so they can be compared as plain strings
+        cutoff_str = (now - timedelta(hours=min_age_hours)).strftime(_BACKUP_TIMESTAMP_FORMAT)
+
+        removal_verb = "Would remove" if dry_run else "Removing"
+
+        # Let the daemon pre-filter by name and use the raw listing, as only ID and name are needed
+        # (the high-level containers.list() would inspect every single container)
+        for container in client.api.containers(all=True, filters={"status": "exited", "name": _BACKUP_MARKER}):
+            container_name = (container.get("Names") or [""])[0].lstrip("/")
+            marker_index = container_name.rfind(_BACKUP_MARKER)
+            if marker_index != -1:
                 try:
                     # Extract timestamp from backup container name
-                    date_str = container_name.split("_bak_cu_")[-1]
-                    container_time = datetime.strptime(date_str, "%Y%m%d-%H%M%S")
-                    age_hours = (now - container_time).total_seconds() / 3600
-
-                    min_age_hours = parse_duration(config.prune.minBackupAge, "h")
-
-                    if age_hours >= min_age_hours:
-                        logging.debug(f"{'Would remove' if dry_run else 'Removing'} container '{container_name}'", extra={"indent": 4})
+                    date_str = container_name[marker_index + len(_BACKUP_MARKER):]
+                    if _BACKUP_TIMESTAMP_PATTERN.fullmatch(date_str) and date_str > cutoff_str:
+                        # Too recent, no need to parse the timestamp
+                        expired = False
+                    else:
+                        # Parsing also rejects well-formed but invalid timestamps (e.g. month 13),
+                        # so such containers are kept instead of being pruned
+                        container_time = datetime.strptime(date_str, _BACKUP_TIMESTAMP_FORMAT)
+                        expired = (now - container_time).total_seconds() / 3600 >= min_age_hours
+
+                    if expired:
+                        logging.debug("%s container '%s'", removal_verb, container_name, extra={"indent": 4})
                         if not dry_run:
-                            container.remove()
-                            removed_count += 1
+                            expired_containers.append((container["Id"], container_name))
 
                 except Exception as e:
                     logging.warning(f"Could not parse or evaluate container '{container_name}' for pruning: {e}", extra={"indent": 4})
 
+        if expired_containers:
+            with ThreadPoolExecutor(max_workers=min(_MAX_REMOVAL_WORKERS, len(expired_containers))) as executor:
+                removed_count = sum(executor.map(remove_backup_container, expired_containers))
+
     except Exception as e:
         logging.error(f"Container cleanup failed: {e}", extra={"indent": 4})
 
@@ -81,27 +117,33 @@ def cleanup_unused_images(client, dry_run=False):
 
     logging.info(f"{'Would remove' if dry_run else 'Removing'} unused images", extra={"indent": 2})
 
-    try:
-        # Get current images before pruning
-        images_before = client.images.list()
-        logging.debug(f"Images before pruning: {len(images_before)}", extra={"indent": 4})
-
-        if not dry_run:
-            result = client.images.prune(
-                filters={
-                    "dangling": False,  # Remove all unused images
-                    "until": "24h",     # Remove images older than 24h
-                }
-            )
-            logging.debug(f"Image prune result: {result}", extra={"indent": 4})
+    if dry_run:
+        # Nothing is pruned in dry-run mode, so don't query the daemon at all
+        return {}
 
+    try:
+        # Listing images inspects every single image, so only do it when the counts are logged
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        if debug_enabled:
+            # Get current images before pruning
+            images_before = client.images.list()
+            logging.debug(f"Images before pruning: {len(images_before)}", extra={"indent": 4})
+
+        result = client.images.prune(
+            filters={
+                "dangling": False,  # Remove all unused images
+                "until": "24h",     # Remove images older than 24h
+            }
+        )
+        logging.debug(f"Image prune result: {result}", extra={"indent": 4})
+
+        if debug_enabled:
             # Get images after pruning
             images_after = client.images.list()
             logging.debug(f"Images after pruning: {len(images_after)} (removed {len(images_before) - len(images_after)})", extra={"indent": 4})
 
-            return result
-        else:
-            return {}
+        return result
 
     except Exception as e:
         logging.error(f"Image cleanup failed: {e}", extra={"indent": 4})
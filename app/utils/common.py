@@ -1,21 +1,65 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import atexit
+import functools
 import json
 import logging
 import os
+import queue
 import re
 import socket
-import subprocess
 import sys
-import docker
 from datetime import datetime
-from fnmatch import fnmatch
-from logging.handlers import RotatingFileHandler
-from typing import Dict, List, Optional, Tuple, Union
+from fnmatch import translate
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from .config import config
 
+# Regular expressions used by the version and duration helpers, compiled once at import time
+# (see _classify_version_scheme for a description of the date scheme)
+_DATE_SCHEME_RE = re.compile(r'^(20)\d{2}\.([1-9]|0[1-9]|1[0-2])\.([0-9]*|0[1-9]|[12]\d|3[01])\.([0-9]*)$')
+_SEMANTIC_SCHEME_RE = re.compile(r'^\d+\.\d+\.\d+')
+_NUMERIC_SCHEME_RE = re.compile(r'^\d+$')
+# Dates in ISO or dot format with optional leading zeroes (YYYY-MM-DD, YYYY.M.D, ...), restricted to months 1-12 and days 1-31
+_DATE_VERSION_RE = re.compile(r'^(\d{4})([-.])(1[0-2]|0[1-9]|[1-9])\2(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])$')
+_DIGIT_RUN_RE = re.compile(r"[0-9]+")
+_DURATION_RE = re.compile(r"^(\d+)([smhd])$")
+_DURATION_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Background listener that owns the real console/file handlers (see setup_logging)
+_log_listener = None
+
+# Docker host hostname as reported by the daemon (see get_docker_host_hostname)
+_docker_host_hostname = None
+
+
+def _stop_log_listener() -> None:
+    """
+    Stop the background log listener, flushing all queued records to its handlers.
+    """
+    global _log_listener
+    if _log_listener:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
+def flush_logging() -> None:
+    """
+    Write out all pending log records before the process terminates.
+
+    Records are handled by a background listener that is otherwise only drained by
+    an atexit hook, so this must be called before exiting via os._exit(), which
+    skips atexit handlers.
+    """
+    _stop_log_listener()
+
 
 def setup_logging(log_level: str = "info", log_file_path: str = "/app/logs/captn.log", dry_run: bool = False) -> None:
     """
@@ -30,6 +74,12 @@ def setup_logging(log_level: str = "info", log_file_path: str = "/app/logs/captn
     The formatter supports an `indent` field in log records, which can be used
     to visually indent multiline output or hierarchical logs.
 
+    The console and file handlers are not attached to the root logger directly.
+    Instead, the root logger only enqueues records via a QueueHandler and a
+    background QueueListener performs the formatting and the actual I/O, so the
+    per-container processing loop never blocks on log writes. Queued records are
+    flushed when the process exits.
+
     Parameters:
         log_level (str): Logging level as string ("debug", "info", "warning", etc.).
                          Defaults to "info". If invalid, falls back to INFO.
@@ -39,20 +89,29 @@ def setup_logging(log_level: str = "info", log_file_path: str = "/app/logs/captn
     log_level = getattr(logging, log_level.upper(), logging.INFO)
 
     class IndentFormatter(logging.Formatter):
+        # Padded locations by (pathname, funcName), as they are the same for every record of a function
+        _location_cache = {}
+
         def format(self, record):
             # Handle indentation (optional extra field)
-            indent_spaces = " " * getattr(record, "indent", 0)
-            record.msg = indent_spaces + str(record.msg).replace("\n", "\n" + indent_spaces)
-
-            # Build relative module path + function name
-            rel_path = os.path.relpath(record.pathname).replace(os.sep, ".")
-            if rel_path.endswith(".py"):
-                rel_path = rel_path[:-3]  # Remove .py extension
-
-            location = f"{rel_path}.{record.funcName}"
-
-            # Pad or truncate to 64
-            location_padded = f"{f'[{location}]':<64}"
+            indent = getattr(record, "indent", 0)
+            if indent:
+                indent_spaces = " " * indent
+                record.msg = indent_spaces + str(record.msg).replace("\n", "\n" + indent_spaces)
+
+            location_key = (record.pathname, record.funcName)
+            location_padded = self._location_cache.get(location_key)
+            if location_padded is None:
+                # Build relative module path + function name
+                rel_path = os.path.relpath(record.pathname).replace(os.sep, ".")
+                if rel_path.endswith(".py"):
+                    rel_path = rel_path[:-3]  # Remove .py extension
+
+                location = f"{rel_path}.{record.funcName}"
+
+                # Pad or truncate to 64
+                location_padded = f"{f'[{location}]':<64}"
+                self._location_cache[location_key] = location_padded
             record.location = location_padded
             return super().format(record)
 
@@ -69,14 +128,18 @@ def setup_logging(log_level: str = "info", log_file_path: str = "/app/logs/captn
             else IndentFormatter("%(asctime)s %(levelname)-8s [DRY_RUN] %(message)s")
         )
 
+    global _log_listener
+
     logger = logging.getLogger()
     logger.setLevel(log_level)
     logger.handlers.clear()
 
+    # Flush and release handlers of a previous setup_logging() call
+    _stop_log_listener()
+
     # StreamHandler for console (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # Ensure log directory exists
     log_dir = os.path.dirname(log_file_path)
@@ -96,7 +159,12 @@ def setup_logging(log_level: str = "info", log_file_path: str = "/app/logs/captn
         backupCount=(20 if log_level == logging.DEBUG else 10),  # Keep up to 20 log files in debug mode, 10 in others
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Hand records off to a background thread which owns the actual handlers
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _log_listener.start()
 
     # Suppress verbose Docker/urllib3 logs unless explicitly debugging
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -123,6 +191,23 @@ def detect_version_scheme(version: str) -> str:
 
     logging.debug(f"Trying to determine version schema for {version}", extra={"indent": 2})
 
+    return _classify_version_scheme(version)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_version_scheme(version: str) -> str:
+    """
+    Classify a normalized version string (see detect_version_scheme()).
+
+    Kept free of logging so it can be memoized, as the same versions are
+    classified repeatedly during a run.
+
+    Parameters:
+        version (str): Normalized version string (e.g. "1.2.3.0")
+
+    Returns:
+        str: Detected versioning scheme
+    """
     # Check for date-based versioning schemes
     #
     # This pattern matches versions in the format:
@@ -144,18 +229,15 @@ def detect_version_scheme(version: str) -> str:
     # The X placeholder represents patch and build numbers that are always appended by normalize_version
     #
     # TL;DR: A valid year schema requires the major version to be between 2000 and 2099, and the minor version to be between 1 and 12.
-    date_pattern = r'^(20)\d{2}\.([1-9]|0[1-9]|1[0-2])\.([0-9]*|0[1-9]|[12]\d|3[01])\.([0-9]*)$'
-    if re.match(date_pattern, version):
+    if _DATE_SCHEME_RE.match(version):
         return 'date'
 
     # Check for semantic versioning (X.Y.Z where X, Y, Z are numbers)
-    semantic_pattern = r'^\d+\.\d+\.\d+'
-    if re.match(semantic_pattern, version):
+    if _SEMANTIC_SCHEME_RE.match(version):
         return 'semantic'
 
     # Check for simple numeric versioning
-    numeric_pattern = r'^\d+$'
-    if re.match(numeric_pattern, version):
+    if _NUMERIC_SCHEME_RE.match(version):
         return 'numeric'
 
     return 'unknown'
@@ -177,6 +259,10 @@ def compare_versions(old_version: str, new_version: str) -> Tuple[str, str]:
             update_type: 'major', 'minor', 'patch', 'build', 'digest', 'unknown', 'scheme_change'
             reason: Explanation of the comparison result
     """
+    # Identical tags are the most common case (no new version), only the digest can differ
+    if old_version == new_version:
+        return 'digest', "Same version, digest change only"
+
     old_scheme = detect_version_scheme(old_version)
     new_scheme = detect_version_scheme(new_version)
 
@@ -258,23 +344,76 @@ def compare_semantic_versions(old_version: str, new_version: str) -> Tuple[str,
         )
         return 'unknown', f"Downgrade detected: {old_version} -> {new_version}"
 
-    old_major, old_minor, old_patch, old_build = old_parts
-    new_major, new_minor, new_patch, new_build = new_parts
-
-    if new_major > old_major:
-        return 'major', f"Major version increase: {old_major} -> {new_major}"
-    elif new_minor > old_minor:
-        return 'minor', f"Minor version increase: {old_minor} -> {new_minor}"
-    elif new_patch > old_patch:
-        return 'patch', f"Patch version increase: {old_patch} -> {new_patch}"
-    elif new_build > old_build:
-        return 'build', f"Build version increase: {old_build} -> {new_build}"
-    elif old_version == new_version:
+    # Downgrades are ruled out, so the first differing component is the one that increased
+    for update_type, old_part, new_part in zip(("major", "minor", "patch", "build"), old_parts, new_parts):
+        if new_part != old_part:
+            return update_type, f"{update_type.capitalize()} version increase: {old_part} -> {new_part}"
+
+    if old_version == new_version:
         return 'digest', "Same version, digest change only"
     else:
         return 'unknown', "No clear version relationship"
 
 
+def _parse_date_version(date_str: str) -> datetime:
+    """
+    Parse a date-based version string in various formats:
+    - YYYY-MM-DD (ISO format with leading zeroes)
+    - YYYY.MM.DD (dot format with leading zeroes)
+    - YYYY-M-D (ISO format without leading zeroes)
+    - YYYY.M.D (dot format without leading zeroes)
+    - YYYY-MM-D, YYYY-M-DD (ISO format mixed)
+    - YYYY.MM.D, YYYY.M.DD (dot format mixed)
+
+    Parameters:
+        date_str (str): Version string to parse
+
+    Returns:
+        datetime: Parsed date
+
+    Raises:
+        ValueError: If the string is not a valid date in one of the supported formats
+    """
+    logging.debug(f"Trying to parse date {date_str} from version/tag name", extra={"indent": 1})
+
+    try:
+        parsed_date = _date_from_version(date_str)
+    except ValueError as e:
+        logging.debug(f"Failed to parse date {date_str}: {e}", extra={"indent": 2})
+        parsed_date = None
+
+    if parsed_date:
+        logging.debug(f"Successfully parsed date: {parsed_date}", extra={"indent": 2})
+        return parsed_date
+
+    logging.debug(f"No valid date pattern matched for: {date_str}", extra={"indent": 2})
+    raise ValueError(f"Invalid date format: {date_str}. Supported formats: YYYY-MM-DD, YYYY.MM.DD, YYYY-M-D, YYYY.M.D, YYYY-MM-D, YYYY-M-DD, YYYY.MM.D, YYYY.M.DD")
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_from_version(date_str: str) -> Optional[datetime]:
+    """
+    Convert a date-based version string into a date (see _parse_date_version()).
+
+    Kept free of logging so it can be memoized, as the same versions are compared repeatedly.
+
+    Parameters:
+        date_str (str): Version string to convert
+
+    Returns:
+        Optional[datetime]: Parsed date, or None if the string has no supported date format
+
+    Raises:
+        ValueError: If the string has a supported format but is not a valid date (e.g. 2024-02-30)
+    """
+    # Same fields as strptime's "%Y-%m-%d"/"%Y.%m.%d", which accept months and days with or without leading zeroes
+    match = _DATE_VERSION_RE.match(date_str)
+    if not match:
+        return None
+    year, _, month, day = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+
 def compare_date_versions(old_version: str, new_version: str) -> Tuple[str, str]:
     """
     Compare date-based versions and determine the type of update.
@@ -303,65 +442,10 @@ def compare_date_versions(old_version: str, new_version: str) -> Tuple[str, str]
         - 'digest': Same date, likely digest-only change
         - 'unknown': Invalid format or newer date is older than current
     """
-    def parse_date(date_str: str) -> datetime:
-        """Parse date string in various formats:
-        - YYYY-MM-DD (ISO format with leading zeroes)
-        - YYYY.MM.DD (dot format with leading zeroes)
-        - YYYY-M-D (ISO format without leading zeroes)
-        - YYYY.M.D (dot format without leading zeroes)
-        - YYYY-MM-D, YYYY-M-DD (ISO format mixed)
-        - YYYY.MM.D, YYYY.M.DD (dot format mixed)
-        """
-
-        logging.debug(f"Trying to parse date {date_str} from version/tag name", extra={"indent": 1})
-
-        # First try standard formats with leading zeroes
-        formats_with_zeroes = [
-            "%Y-%m-%d",  # YYYY-MM-DD (ISO with leading zeroes)
-            "%Y.%m.%d",  # YYYY.MM.DD (dot with leading zeroes)
-        ]
-
-        for fmt in formats_with_zeroes:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                logging.debug(f"Successfully parsed date with standard format {fmt}: {parsed_date}", extra={"indent": 2})
-                return parsed_date
-            except ValueError:
-                logging.debug(f"Failed to parse with format {fmt}: {date_str}", extra={"indent": 2})
-                continue
-
-        # For formats without leading zeroes, manually parse and normalize
-        import re
-
-        # Check if it matches patterns with mixed leading zeroes
-        # These patterns handle all combinations: YYYY-MM-D, YYYY-M-DD, YYYY-M-D, etc.
-        # Note: We use more restrictive patterns to ensure valid dates (months 1-12, days 1-31)
-        iso_pattern = r'^(\d{4})-([1-9]|0[1-9]|1[0-2])-([1-9]|0[1-9]|[12]\d|3[01])$'
-        dot_pattern = r'^(\d{4})\.([1-9]|0[1-9]|1[0-2])\.([1-9]|0[1-9]|[12]\d|3[01])$'
-
-        for pattern, separator in [(iso_pattern, '-'), (dot_pattern, '.')]:
-            match = re.match(pattern, date_str)
-            if match:
-                year, month, day = match.groups()
-                logging.debug(f"Date pattern matched: {date_str} -> year={year}, month={month}, day={day}", extra={"indent": 2})
-                # Normalize by adding leading zeroes
-                normalized_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                logging.debug(f"Normalized date: {normalized_date}", extra={"indent": 2})
-                try:
-                    parsed_date = datetime.strptime(normalized_date, "%Y-%m-%d")
-                    logging.debug(f"Successfully parsed date: {parsed_date}", extra={"indent": 2})
-                    return parsed_date
-                except ValueError as e:
-                    logging.debug(f"Failed to parse normalized date {normalized_date}: {e}", extra={"indent": 2})
-                    continue
-
-        logging.debug(f"No valid date pattern matched for: {date_str}", extra={"indent": 2})
-        raise ValueError(f"Invalid date format: {date_str}. Supported formats: YYYY-MM-DD, YYYY.MM.DD, YYYY-M-D, YYYY.M.D, YYYY-MM-D, YYYY-M-DD, YYYY.MM.D, YYYY.M.DD")
-
     try:
         # Parse dates
-        old_date = parse_date(old_version)
-        new_date = parse_date(new_version)
+        old_date = _parse_date_version(old_version)
+        new_date = _parse_date_version(new_version)
 
         logging.debug(f"Comparing dates from version/tag name: new({new_date}) old({old_date})", extra={"indent": 2})
 
@@ -391,26 +475,37 @@ def get_docker_host_hostname() -> str:
     2. Environment variables (HOSTNAME, DOCKER_HOST_HOSTNAME)
     3. Fallback to container hostname
 
+    The hostname reported by the Docker daemon is cached for the lifetime of the
+    process, so the daemon is only queried until it answered once.
+
     Returns:
         str: The hostname of the Docker host, or container hostname as fallback
     """
+    global _docker_host_hostname
+
+    if _docker_host_hostname:
+        return _docker_host_hostname
+
     logging.debug(f"Trying to determine hostname", extra={"indent": 0})
 
     # Method 1: Try to get hostname from Docker daemon info
     try:
-        client = docker.from_env()
+        from .engines import get_client  # Local import, the engines depend on this module
+
+        client = get_client()
         info = client.info()
         hostname = info.get('Name')
         if hostname == "docker-desktop":
             logging.debug(f"Ignoring hostname from daemon: {hostname}", extra={"indent": 2})
         if hostname and hostname != "docker-desktop":
             logging.debug(f"Found Docker host hostname from daemon info: {hostname}", extra={"indent": 2})
+            _docker_host_hostname = hostname
             return hostname
     except Exception as e:
         logging.debug(f"Could not get hostname from Docker daemon info: {e}", extra={"indent": 2})
 
     # Method 2: Check environment variables
-    hostname = os.environ.get('HOSTNAME') or os.environ.get('DOCKER_HOST_HOSTNAME', extra={"indent": 2})
+    hostname = os.environ.get('HOSTNAME') or os.environ.get('DOCKER_HOST_HOSTNAME')
     if hostname:
         logging.debug(f"Found Docker host hostname from environment: {hostname}", extra={"indent": 2})
         return hostname
@@ -463,6 +558,7 @@ def compare_numeric_versions(old_version: str, new_version: str) -> Tuple[str, s
         return 'unknown', "Invalid numeric version format"
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_version(version: str) -> Tuple[int, int, int, int]:
     """
     Cleans a version string and returns a 4-part numeric tuple (major, minor, patch, build).
@@ -476,27 +572,22 @@ def normalize_version(version: str) -> Tuple[int, int, int, int]:
     Returns:
         Tuple[int, int, int, int]: Normalized version as (major, minor, patch, build).
                                   Returns (-1, -1, -1, -1) for invalid formats.
-    """
-    version = version.lower().strip()
 
-    # Replace any non-digit separator (except dots) with a dot
-    version = re.sub(r"[^0-9\.]+", ".", version)
-
-    # Reduce multiple consecutive dots
-    version = re.sub(r"\.+", ".", version).strip(".")
-
-    parts = version.split(".")
+    Results are memoized, as the same tags are normalized repeatedly while sorting and comparing.
+    """
+    # Every run of digits is a version part, all other characters are separators
+    parts = [int(p) for p in _DIGIT_RUN_RE.findall(version)[:4]]
 
-    if not all(p.isdigit() for p in parts[:4]):
+    if not parts:
         return (-1, -1, -1, -1)
 
-    parts = [int(p) for p in parts[:4]]  # type: ignore[misc]
     while len(parts) < 4:
         parts.append(0)
 
-    return tuple(parts[:4])  # type: ignore[return-value]
+    return tuple(parts)  # type: ignore[return-value]
 
 
+@functools.lru_cache(maxsize=32)
 def parse_duration(duration_str, return_unit="m"):
     """
     Converts duration strings like '10m', '2h', '1d' into desired unit.
@@ -513,8 +604,10 @@ def parse_duration(duration_str, return_unit="m"):
 
     Raises:
         ValueError: If the duration string format is invalid
+
+    Results are memoized, as the same few configured durations are parsed repeatedly.
     """
-    match = re.match(r"^(\d+)([smhd])$", duration_str)
+    match = _DURATION_RE.match(duration_str)
     if not match:
         raise ValueError(f"Invalid duration format: {duration_str}")
 
@@ -522,10 +615,11 @@ def parse_duration(duration_str, return_unit="m"):
     value = int(value)
 
     # duration in seconds
-    seconds = {"s": value, "m": value * 60, "h": value * 3600, "d": value * 86400}[unit]
+    seconds = value * _DURATION_UNIT_SECONDS[unit]
 
-    # convert to requested unit
-    return {"s": seconds, "m": seconds / 60, "h": seconds / 3600, "d": seconds / 86400}[return_unit]
+    # convert to requested unit (seconds are returned as int)
+    unit_seconds = _DURATION_UNIT_SECONDS[return_unit]
+    return seconds if unit_seconds == 1 else seconds / unit_seconds
 
 
 def get_update_type(old_version, new_version, local_digests, remote_digest):
@@ -557,21 +651,23 @@ def get_update_type(old_version, new_version, local_digests, remote_digest):
     """
 
     logging.debug(f"Determining update type for remote tag {new_version}", extra={"indent": 2})
-    logging.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 4})
-
-    # Remove prefixes like "ghcr.io/immich-app/immich-server@sha256:" or "sha256:"
-    remote_digest = remote_digest.rsplit(":", 1)[-1] if remote_digest and ":" in remote_digest else remote_digest
-    local_digests = [
-        local_digest.rsplit(":", 1)[-1] if local_digest and ":" in local_digest else local_digest
-        for local_digest in local_digests
-    ]
-
-    logging.debug(f"remote_digest (normalized): {remote_digest}", extra={"indent": 4})
-    logging.debug(f"local_digests (normalized): {local_digests}", extra={"indent": 4})
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 4})
 
     # Use intelligent version comparison to handle different versioning schemes
     update_type, reason = compare_versions(old_version, new_version)
     if update_type in ["digest", "unknown"]:
+        # Digests are only relevant if the versions do not differ
+        # Remove prefixes like "ghcr.io/immich-app/immich-server@sha256:" or "sha256:"
+        remote_digest = remote_digest.rsplit(":", 1)[-1] if remote_digest and ":" in remote_digest else remote_digest
+        local_digests = {
+            local_digest.rsplit(":", 1)[-1] if local_digest and ":" in local_digest else local_digest
+            for local_digest in local_digests or ()
+        }
+
+        logging.debug(f"remote_digest (normalized): {remote_digest}", extra={"indent": 4})
+        logging.debug(f"local_digests (normalized): {local_digests}", extra={"indent": 4})
+
         if remote_digest not in local_digests:
             update_type = "digest"
             reason = reason
@@ -583,6 +679,195 @@ def get_update_type(old_version, new_version, local_digests, remote_digest):
     return update_type
 
 
+@functools.lru_cache(maxsize=128)
+def parse_rule(rule_json: str) -> dict:
+    """
+    Parse a rule definition from its raw JSON string.
+
+    The cache is keyed by the raw string rather than the rule name, so a reloaded
+    configuration with changed rule content is never served stale results.
+    The returned dict is shared between callers and must not be modified.
+
+    Parameters:
+        rule_json (str): Raw JSON string of the rule as stored in the configuration
+
+    Returns:
+        dict: Parsed rule configuration
+
+    Raises:
+        ValueError: If the rule is not valid JSON
+    """
+    return json.loads(rule_json)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_allowed_update_types(rule_json: str) -> frozenset:
+    """
+    Get the update types a rule allows, cached by the rule's raw JSON string.
+
+    Parameters:
+        rule_json (str): Raw JSON string of the rule as stored in the configuration
+
+    Returns:
+        frozenset: Update types enabled in the rule's 'allow' section
+    """
+    return frozenset(update_type for update_type, is_allowed in parse_rule(rule_json).get("allow", {}).items() if is_allowed)
+
+
+def load_rules() -> Dict[str, dict]:
+    """
+    Load all configured update rules.
+
+    Rules are parsed through parse_rule(), so each distinct rule definition is only
+    decoded once. Rules with invalid JSON are logged and skipped.
+
+    Returns:
+        Dict[str, dict]: Parsed rules by rule name
+    """
+    rules = {}
+    for key, rule_json in config.rules._values.items():
+        try:
+            rules[key] = parse_rule(rule_json)
+        except Exception as e:
+            logging.error(f"Failed to parse rule '{key}': invalid JSON format {e}", extra={"indent": 4})
+    return rules
+
+
+def _get_assignment_section(name: str) -> dict:
+    """
+    Get the raw values of a rule assignment section of the configuration.
+
+    Parameters:
+        name (str): Name of the configuration section (e.g. "assignmentsByImage")
+
+    Returns:
+        dict: Assignment values of the section, or an empty dict if it is not configured
+    """
+    section = getattr(config, name, None)
+    if hasattr(section, "_values"):
+        return section._values
+    elif isinstance(section, dict):
+        return section
+    return {}
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_assignment_patterns(assignments: tuple) -> Callable[[str], Optional[str]]:
+    """
+    Combine fnmatch-style assignment patterns into a single compiled regex.
+
+    The patterns are joined into one alternation in their configured order, so a
+    single regex match finds the first matching pattern, just like checking the
+    patterns one after another.
+
+    Parameters:
+        assignments (tuple): (pattern, rule name) pairs of an assignment section
+
+    Returns:
+        Callable[[str], Optional[str]]: Function returning the rule name of the first
+                                        pattern matching an image reference, or None
+    """
+    if not assignments:
+        return lambda image_reference: None
+
+    regex = re.compile("|".join(f"(?P<rule{i}>{translate(pattern)})" for i, (pattern, _) in enumerate(assignments)))
+    rule_names = [rule_name for _, rule_name in assignments]
+
+    def first_match(image_reference):
+        match = regex.match(image_reference)
+        return rule_names[int(match.lastgroup[4:])] if match else None
+
+    return first_match
+
+
+def get_rule_assignments() -> Dict[str, Union[dict, Callable[[str], Optional[str]]]]:
+    """
+    Get the configured rule assignments by container name, image and image ID.
+
+    The image and image ID sections are returned as lookup functions mapping an
+    image reference to the assigned rule name (or None), so their fnmatch patterns
+    are only translated and compiled once.
+
+    Returns:
+        Dict[str, Union[dict, Callable]]: Assignment sections keyed 'by_name', 'by_image' and 'by_id'
+    """
+    return {
+        "by_name": _get_assignment_section("assignments") or _get_assignment_section("assignmentsByName"),
+        "by_image": _compile_assignment_patterns(tuple(_get_assignment_section("assignmentsByImage").items())),
+        "by_id": _compile_assignment_patterns(tuple(_get_assignment_section("assignmentsById").items())),
+    }
+
+
+def _strip_image_reference(image_reference: Optional[str]) -> Optional[str]:
+    """
+    Remove tag and digest from an image reference, as used for image based rule assignment.
+
+    Parameters:
+        image_reference (str): Image reference (e.g. "nginx:1.23.4" or "nginx@sha256:...")
+
+    Returns:
+        Optional[str]: Image reference without tag and digest (e.g. "nginx")
+    """
+    return image_reference.split(":", 1)[0].split("@", 1)[0] if image_reference else image_reference
+
+
+def may_assign_rule_by_image(container_name: str) -> bool:
+    """
+    Check whether the rule of a container may depend on its image reference.
+
+    This is the case if the container has no rule assigned by name and rule
+    assignments by image or image ID are configured.
+
+    Parameters:
+        container_name (str): Name of the container
+
+    Returns:
+        bool: True if the image reference is needed to resolve the container's rule
+    """
+    assignments = get_rule_assignments()
+    if assignments["by_name"].get(container_name):
+        return False
+    return bool(_get_assignment_section("assignmentsByImage") or _get_assignment_section("assignmentsById"))
+
+
+def resolve_rule(container_name: str, image_reference: Optional[str] = None) -> Tuple[dict, str, str]:
+    """
+    Resolve the update rule assigned to a container.
+
+    Rules are assigned by container name first, then by image reference and image ID
+    patterns, falling back to the 'default' rule if no assignment matches or the
+    assigned rule is not defined.
+
+    Parameters:
+        container_name (str): Name of the container
+        image_reference (str): Image reference without tag or digest (optional, for image-based rule assignment)
+
+    Returns:
+        Tuple[dict, str, str]:
+            - rule (dict): Parsed rule configuration (shared, must not be modified)
+            - effective_rule_name (str): Name of the rule used for decision
+            - originally_assigned_rule_name (str): Name of the rule assigned before fallback
+    """
+    rules = load_rules()
+    assignments = get_rule_assignments()
+
+    # Rule name assignment logic (image based assignments require an image reference)
+    rule_name_original = (
+        assignments["by_name"].get(container_name)
+        or (image_reference and assignments["by_image"](image_reference))
+        or (image_reference and assignments["by_id"](image_reference))
+        or "default"
+    )
+
+    # Fallback to default if not defined
+    rule_name = rule_name_original
+    if rule_name not in rules:
+        logging.warning(f"Rule '{rule_name}' not found, falling back to 'default'", extra={"indent": 4})
+        rule_name = "default"
+
+    return rules.get(rule_name, {}), rule_name, rule_name_original
+
+
 def get_update_permit( container_name=None, image_reference=None, update_type=None, age=None, old_version=None, new_version=None, latest_version=None, pre_check=False, ) -> Tuple[bool, str, str, str, str]:
     """
     Determine whether an update of a specific type is permitted for a given container.
@@ -623,84 +908,29 @@ def get_update_permit( container_name=None, image_reference=None, update_type=No
             - reject_reason (str): Reason for rejection if update is not allowed
             - new_image_reference (str): Full image reference for the update
     """
-    # Remove tag and digest from image reference
-    image_reference = (
-        image_reference.split(":", 1)[0].split("@", 1)[0]
-        if image_reference
-        else image_reference
-    )
+    image_reference = _strip_image_reference(image_reference)
     old_major, old_minor, old_patch, old_build = normalize_version(old_version)
     new_major, new_minor, new_patch, new_build = normalize_version(new_version)
     latest_major, latest_minor, latest_patch, latest_build = normalize_version(latest_version)
 
     update_info = f"{old_version} -> {new_version}" if update_type != "digest" else f"{old_version}"
-    logging.debug( f"{'Pre-checking' if pre_check else 'Checking'} update permission of '{container_name}' for update type {update_type} ({update_info})", extra={"indent": 2}, )
-    logging.debug( f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 4}, )
-
-    # Load rules
-    raw_rules = config.rules
-    rules = {}
-    for key in raw_rules._values:
-        try:
-            rules[key] = json.loads(raw_rules._values[key])
-        except Exception as e:
-            logging.error( f"Failed to parse rule '{key}': invalid JSON format {e}", extra={"indent": 4}, )
-            logging.error(f"{e}", extra={"indent": 4})
-            continue
-
-    # Assignment helper
-    def get_assignment_section(name):
-        section = getattr(config, name, None)
-        if hasattr(section, "_values"):
-            return section._values
-        elif isinstance(section, dict):
-            return section
-        return {}
-
-    assignments = {
-        "by_name": get_assignment_section("assignments") or get_assignment_section("assignmentsByName"),
-        "by_image": get_assignment_section("assignmentsByImage"),
-        "by_id": get_assignment_section("assignmentsById"),
-    }
-
-    # Rule name assignment logic
-    rule_name_original = (
-        assignments["by_name"].get(container_name)
-        or next(
-            (
-                r
-                for p, r in assignments["by_image"].items()
-                if fnmatch(image_reference, p)
-            ),
-            None,
-        )
-        or next(
-            (r for p, r in assignments["by_id"].items() if fnmatch(image_reference, p)),
-            None,
-        )
-        or "default"
-    )
-
-    # Fallback to default if not defined
-    rule_name = rule_name_original
-    if rule_name not in rules:
-        logging.warning( f"Rule '{rule_name}' not found, falling back to 'default'", extra={"indent": 4}, )
-        rule_name = "default"
+    check_label = ", Pre-Check" if pre_check else ""
+    logging.debug("%s update permission of '%s' for update type %s (%s)", "Pre-checking" if pre_check else "Checking", container_name, update_type, update_info, extra={"indent": 2})
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug( f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 4}, )
 
-    rule = rules.get(rule_name, {})
-    logging.debug(f"rule_name: {rule_name}", extra={"indent": 4})
-    logging.debug(f"rule:\n{json.dumps(rule, indent=4)}", extra={"indent": 4})
+    rule, rule_name, rule_name_original = resolve_rule(container_name, image_reference)
+    logging.debug("rule_name: %s", rule_name, extra={"indent": 4})
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"rule:\n{json.dumps(rule, indent=4)}", extra={"indent": 4})
 
     allowed = rule.get("allow", {}).get(update_type, False)
-    logging.debug( f"[General{', Pre-Check' if pre_check else ''}] {update_type.capitalize()} updates are generally{' not' if not allowed else ''} allowed for {container_name}", extra={"indent": 4}, )
+    logging.debug("[General%s] %s updates are generally%s allowed for %s", check_label, update_type.capitalize(), "" if allowed else " not", container_name, extra={"indent": 4})
 
     # Check additional conditions
     conditions = rule.get("conditions", {}).get(update_type)
-    (
-        logging.debug( f"[Conditions{', Pre-Check' if pre_check else ''}] conditions:\n{json.dumps(conditions, indent=4)}", extra={"indent": 4}, )
-        if conditions
-        else None
-    )
+    if conditions and logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"[Conditions{check_label}] conditions:\n{json.dumps(conditions, indent=4)}", extra={"indent": 4})
 
     if allowed and conditions:
         satisfied = False
@@ -715,7 +945,7 @@ def get_update_permit( container_name=None, image_reference=None, update_type=No
                 satisfied = True
 
         if not satisfied:
-            logging.debug( f"[Conditions{', Pre-Check' if pre_check else ''}] Required conditions for {update_type} updates not satisfied", extra={"indent": 4}, )
+            logging.debug("[Conditions%s] Required conditions for %s updates not satisfied", check_label, update_type, extra={"indent": 4})
             return (
                 False,
                 rule_name,
@@ -724,18 +954,14 @@ def get_update_permit( container_name=None, image_reference=None, update_type=No
                 f"{image_reference}:{new_version}",
             )
 
-        logging.debug( f"[Conditions{', Pre-Check' if pre_check else ''}] Required conditions for {update_type} updates have been satisfied", extra={"indent": 4}, )
+        logging.debug("[Conditions%s] Required conditions for %s updates have been satisfied", check_label, update_type, extra={"indent": 4})
 
     # Check update lag policy
     configured_lag = rule.get("lagPolicy", {}).get(update_type)
-    (
-        logging.debug( f"[LagPolicy{', Pre-Check' if pre_check else ''}] Configured policy requires staying always {configured_lag} version{'s' if configured_lag and configured_lag > 1 else ''} behind for {update_type} updates", extra={"indent": 4}, )
-        if configured_lag
-        else logging.debug(
-            f"[LagPolicy{', Pre-Check' if pre_check else ''}] Not configured",
-            extra={"indent": 4},
-        )
-    )
+    if configured_lag:
+        logging.debug("[LagPolicy%s] Configured policy requires staying always %s version%s behind for %s updates", check_label, configured_lag, "s" if configured_lag > 1 else "", update_type, extra={"indent": 4})
+    else:
+        logging.debug("[LagPolicy%s] Not configured", check_label, extra={"indent": 4})
 
     if allowed and configured_lag and latest_version and new_version:
         lag = 0
@@ -748,10 +974,10 @@ def get_update_permit( container_name=None, image_reference=None, update_type=No
         elif update_type == "build":
             lag = (latest_build - new_build) + 1
 
-        logging.debug( f"[LagPolicy{', Pre-Check' if pre_check else ''}] Calculated lag for this {update_type} update from {old_version} to {new_version}: {lag} (required: > {configured_lag})", extra={"indent": 4}, )
+        logging.debug("[LagPolicy%s] Calculated lag for this %s update from %s to %s: %s (required: > %s)", check_label, update_type, old_version, new_version, lag, configured_lag, extra={"indent": 4})
 
         if lag <= configured_lag:
-            logging.debug( f"[LagPolicy{', Pre-Check' if pre_check else ''}] Insufficient version lag for {update_type} update from {old_version} to {new_version} according to policy", extra={"indent": 4}, )
+            logging.debug("[LagPolicy%s] Insufficient version lag for %s update from %s to %s according to policy", check_label, update_type, old_version, new_version, extra={"indent": 4})
             return (
                 False,
                 rule_name,
@@ -760,22 +986,19 @@ def get_update_permit( container_name=None, image_reference=None, update_type=No
                 f"{image_reference}:{new_version}",
             )
 
-        logging.debug( f"[LagPolicy{', Pre-Check' if pre_check else ''}] Version lag requirement satisfied for {update_type} update from {old_version} to {new_version}", extra={"indent": 4}, )
+        logging.debug("[LagPolicy%s] Version lag requirement satisfied for %s update from %s to %s", check_label, update_type, old_version, new_version, extra={"indent": 4})
 
     # Check minimum image age
     min_age_default = "30m"
     min_age_config = rule.get("minImageAge", min_age_default)
-    (
-        logging.debug( f"[MinImageAge{', Pre-Check' if pre_check else ''}] Not configured, using default of '{min_age_default}'", extra={"indent": 4}, )
-        if not rule.get("minImageAge")
-        else None
-    )
+    if not rule.get("minImageAge"):
+        logging.debug("[MinImageAge%s] Not configured, using default of '%s'", check_label, min_age_default, extra={"indent": 4})
 
     if allowed and min_age_config and age:
         try:
             min_age_minutes = parse_duration(min_age_config)
             if age < min_age_minutes:
-                logging.debug( f"[MinImageAge{', Pre-Check' if pre_check else ''}] Insufficient image age of {int(age)} min (required: >= {int(min_age_minutes)} min)", extra={"indent": 4}, )
+                logging.debug("[MinImageAge%s] Insufficient image age of %d min (required: >= %d min)", check_label, age, min_age_minutes, extra={"indent": 4})
                 return (
                     False,
                     rule_name,
@@ -784,11 +1007,11 @@ def get_update_permit( container_name=None, image_reference=None, update_type=No
                     f"{image_reference}:{new_version}",
                 )
             else:
-                logging.debug( f"[MinImageAge{', Pre-Check' if pre_check else ''}] Image age requirement satisfied ({int(age)} min >= {int(min_age_minutes)} min)", extra={"indent": 4}, )
+                logging.debug("[MinImageAge%s] Image age requirement satisfied (%d min >= %d min)", check_label, age, min_age_minutes, extra={"indent": 4})
         except Exception as e:
-            logging.warning( f"[MinImageAge{', Pre-Check' if pre_check else ''}] Failed to evaluate image age: {e}", extra={"indent": 4}, )
+            logging.warning(f"[MinImageAge{check_label}] Failed to evaluate image age: {e}", extra={"indent": 4})
     elif not age:
-        logging.warning( f"[MinImageAge{', Pre-Check' if pre_check else ''}] Unable to determine image creation timestamp - Skipping minimum age policy evaluation", extra={"indent": 4}, )
+        logging.warning(f"[MinImageAge{check_label}] Unable to determine image creation timestamp - Skipping minimum age policy evaluation", extra={"indent": 4})
 
     return (
         allowed,
@@ -818,7 +1041,7 @@ def get_container_backup_name(original_name):
     return f"{original_name}_bak_cu_{timestamp}"
 
 
-def get_container_allowed_update_types( container_name, image_reference=None ) -> Tuple[set, str, str]:
+def get_container_allowed_update_types( container_name, image_reference=None ) -> Tuple[frozenset, str, str]:
     """
     Efficiently determine which update types are allowed for a container.
 
@@ -831,79 +1054,13 @@ def get_container_allowed_update_types( container_name, image_reference=None ) -
         image_reference (str): Full image reference (optional, for image-based rule assignment)
 
     Returns:
-        Tuple[set, str, str]:
-            - allowed_types (set): Set of allowed update types ('major', 'minor', 'patch', 'build', 'digest')
+        Tuple[frozenset, str, str]:
+            - allowed_types (frozenset): Set of allowed update types ('major', 'minor', 'patch', 'build', 'digest')
             - effective_rule_name (str): Name of the rule used for decision
             - originally_assigned_rule_name (str): Name of the rule assigned before fallback
     """
-    image_reference = (
-        image_reference.split(":", 1)[0]
-        if image_reference and ":" in image_reference
-        else image_reference
-    )
-
-    # Load rules
-    raw_rules = config.rules
-    rules = {}
-    for key in raw_rules._values:
-        try:
-            rules[key] = json.loads(raw_rules._values[key])
-        except Exception as e:
-            logging.error(
-                f"Failed to parse rule '{key}': invalid JSON format {e}",
-                extra={"indent": 4},
-            )
-            continue
-
-    # Assignment helper
-    def get_assignment_section(name):
-        section = getattr(config, name, None)
-        if hasattr(section, "_values"):
-            return section._values
-        elif isinstance(section, dict):
-            return section
-        return {}
-
-    assignments = {
-        "by_name": get_assignment_section("assignments") or get_assignment_section("assignmentsByName"),
-        "by_image": get_assignment_section("assignmentsByImage"),
-        "by_id": get_assignment_section("assignmentsById"),
-    }
-
-    # Rule name assignment logic
-    rule_name_original = (
-        assignments["by_name"].get(container_name)
-        or next(
-            (
-                r
-                for p, r in assignments["by_image"].items()
-                if fnmatch(image_reference, p)
-            ),
-            None,
-        )
-        or next(
-            (r for p, r in assignments["by_id"].items() if fnmatch(image_reference, p)),
-            None,
-        )
-        or "default"
-    )
-
-    # Fallback to default if not defined
-    rule_name = rule_name_original
-    if rule_name not in rules:
-        logging.warning(
-            f"Rule '{rule_name}' not found, falling back to 'default'",
-            extra={"indent": 4},
-        )
-        rule_name = "default"
-
-    rule = rules.get(rule_name, {})
-    allowed_config = rule.get("allow", {})
-
-    # Extract allowed update types
-    allowed_types = set()
-    for update_type, is_allowed in allowed_config.items():
-        if is_allowed:
-            allowed_types.add(update_type)
+    rule, rule_name, rule_name_original = resolve_rule(container_name, _strip_image_reference(image_reference))
+    # An empty rule may also stand for an undefined or invalid default rule
+    allowed_types = _get_allowed_update_types(config.rules._values[rule_name]) if rule else frozenset()
 
     return allowed_types, rule_name, rule_name_original
@@ -1,4 +1,3 @@
-import configparser
 import json
 import os
 import re
@@ -13,6 +12,7 @@ DEFAULTS = {
     },
     "update": {
         "delayBetweenUpdates": "2m",
+        "maxWorkers": "1",
     },
     "updateVerification": {
         "maxWait": "480s",
@@ -211,6 +211,86 @@ DEFAULTS = {
 }
 
 
+# INI syntax as understood by configparser: "[section]" headers and "key = value" or "key: value" options
+_SECTION_RE = re.compile(r"\[(?P<header>.+)\]")
+_OPTION_RE = re.compile(r"(?P<option>.*?)\s*[=:]\s*(?P<value>.*)$")
+_COMMENT_PREFIXES = ("#", ";")
+_DEFAULT_SECTION = "DEFAULT"
+
+
+def _read_config_file(config_path: str) -> dict:
+    """
+    Read an INI style configuration file into a dictionary of sections.
+
+    This is a single-pass reader for the subset of the configparser format used by
+    captn.cfg: section headers, '=' or ':' delimited options, full-line '#'/';'
+    comments and multi-line values continued on more deeply indented lines
+    (e.g. JSON rules). Option names keep their case and options of a [DEFAULT]
+    section are inherited by all other sections. As with configparser, '%%' in a
+    value stands for a literal '%'; a single '%' is kept as-is instead of raising
+    an interpolation error. A missing file results in an empty configuration.
+
+    Parameters:
+        config_path (str): Path to the configuration file
+
+    Returns:
+        dict: Mapping of section names to dictionaries of option values
+
+    Raises:
+        ValueError: If the file contains options outside of a section, duplicate
+                    sections or options, or lines that cannot be parsed
+    """
+    try:
+        with open(config_path, encoding="utf-8") as config_file:
+            lines = config_file.read().splitlines()
+    except OSError:
+        return {}
+
+    sections = {}
+    current = None
+    option = None
+    indent_level = 0
+
+    for lineno, line in enumerate(lines, start=1):
+        value = line.strip()
+        if not value or value.startswith(_COMMENT_PREFIXES):
+            # Blank lines are kept inside multi-line values, comment lines are dropped
+            if not value and option:
+                current[option].append("")
+            continue
+
+        cur_indent_level = len(line) - len(line.lstrip())
+        if option and cur_indent_level > indent_level:
+            current[option].append(value)
+            continue
+
+        indent_level = cur_indent_level
+        option = None
+        if match := _SECTION_RE.match(value):
+            header = match.group("header")
+            if header in sections and header != _DEFAULT_SECTION:
+                raise ValueError(f"{config_path}, line {lineno}: Duplicate section '{header}'")
+            current = sections.setdefault(header, {})
+        elif current is None:
+            raise ValueError(f"{config_path}, line {lineno}: Option outside of a section: {line!r}")
+        elif (match := _OPTION_RE.match(value)) and match.group("option"):
+            option = match.group("option")
+            if option in current:
+                raise ValueError(f"{config_path}, line {lineno}: Duplicate option '{option}'")
+            current[option] = [match.group("value")]
+        else:
+            raise ValueError(f"{config_path}, line {lineno}: Unable to parse line: {line!r}")
+
+    defaults = sections.pop(_DEFAULT_SECTION, {})
+    return {
+        section: {
+            option: "\n".join(value).rstrip().replace("%%", "%")
+            for option, value in {**defaults, **options}.items()
+        }
+        for section, options in sections.items()
+    }
+
+
 class ConfigNamespace:
     """
     A namespace wrapper for configuration sections that provides automatic type casting.
@@ -288,6 +368,9 @@ class Config:
     and includes comprehensive validation of configuration values.
     """
 
+    # Validated sections of the last successfully loaded file per path, with the file stamp they were loaded from
+    _cache = {}
+
     def __init__(self, config_path: str = "/app/conf/captn.cfg"):
         """
         Initialize the configuration manager.
@@ -304,16 +387,29 @@ class Config:
 
         This method reads the configuration file, merges it with default values,
         and validates the resulting configuration structure.
+
+        The loaded configuration is reused as long as the file's modification time
+        and size are unchanged, so the periodic reloads of the scheduler only cost
+        a stat() call.
         """
-        parser = configparser.ConfigParser()
-        parser.optionxform = lambda optionstr: str(optionstr)  # disables lowercasing of keys
-        parser.read(self.config_path)
+        path = os.path.abspath(self.config_path)
+        try:
+            stat = os.stat(path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+
+        cached = Config._cache.get(path)
+        if cached and cached[0] == stamp:
+            self._namespaces = cached[1]
+            return
+
+        sections = _read_config_file(self.config_path)
         self._namespaces = {}
 
-        for section in set(DEFAULTS.keys()).union(parser.sections()):
+        for section in set(DEFAULTS.keys()).union(sections):
             values = dict(DEFAULTS.get(section, {}))
-            if parser.has_section(section):
-                values.update(parser[section])
+            values.update(sections.get(section, {}))
             self._namespaces[section] = ConfigNamespace(section, values)
 
         # Dot-notation support: e.g. notifiers.telegram will be available as attribute of `notifiers`
@@ -325,6 +421,7 @@ class Config:
 
         # Validate configuration after loading
         self.validate_config()
+        Config._cache[path] = (stamp, self._namespaces)
 
     def reload(self):
         """
@@ -384,6 +481,9 @@ class Config:
             if hasattr(update, "delayBetweenUpdates"):
                 if not self.is_valid_duration(update.delayBetweenUpdates):
                     errors.append("update.delayBetweenUpdates must be a valid duration (e.g., '15s', '2m', '1h')")
+            if hasattr(update, "maxWorkers"):
+                if isinstance(update.maxWorkers, bool) or not isinstance(update.maxWorkers, int) or update.maxWorkers < 1:
+                    errors.append("update.maxWorkers must be a positive integer")
 
         # Validate updateVerification section
         if "updateVerification" in self._namespaces:
@@ -622,9 +722,8 @@ class Config:
         """
         if not isinstance(value, str):
             return False
-        # Pattern: number followed by unit (s, m, h, d)
-        pattern = r'^\d+[smhd]$'
-        return bool(re.match(pattern, value))
+        # Number followed by unit (s, m, h, d)
+        return value[-1:] in ("s", "m", "h", "d") and value[:-1].isdecimal()
 
     def is_valid_url(self, value):
         """
@@ -895,6 +994,18 @@ timeout =
 # Default: "{DEFAULTS['update']['delayBetweenUpdates']}" (2 minutes)
 delayBetweenUpdates =
 
+# Number of containers that are processed concurrently
+# Containers are independent of each other, so inspection, registry lookups and image pulls
+# of multiple containers can run in parallel. Each container is still processed by a single worker.
+# Note: With values greater than 1 the log output of different containers is interleaved,
+#       use 1 when a readable, per-container log (e.g. with --log-level debug) is needed
+# Possible values: Positive integer
+#   Minimum: 1
+#   Maximum: -
+#   Examples: 1, 4, 8
+# Default: {DEFAULTS['update']['maxWorkers']}
+maxWorkers =
+
 [updateVerification]
 # Maximum time to wait for a container to become stable after update
 # If container doesn't become stable within this time, it's considered failed
@@ -37,6 +37,26 @@ def get_containers(filters, client):
         return docker.get_containers(filters, client)
 
 
+def get_image(client, image_id):
+    """
+    Get a local container image by its ID.
+
+    Images are cached by the engine, so containers sharing the same image
+    only cause a single image inspection.
+
+    Parameters:
+        client: Container engine client instance
+        image_id (str): ID of the local image
+
+    Returns:
+        Image object
+    """
+    engine = "docker"
+
+    if engine == "docker":
+        return docker.get_image(client, image_id)
+
+
 def get_local_image_metadata(image, container_inspect_data):
     """
     Get metadata for a local container image.
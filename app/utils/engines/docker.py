@@ -5,11 +5,15 @@ import fnmatch
 import json
 import logging
 import os
+import re
+import threading
 import time
 from datetime import datetime
+from logging import DEBUG
 
 import docker
 from docker import errors as docker_errors
+from docker.constants import DEFAULT_MAX_POOL_SIZE
 from docker.types import Mount
 
 from ..common import get_container_backup_name, parse_duration
@@ -18,6 +22,14 @@ from ..scripts import execute_post_script, should_rollback_on_post_failure
 
 logging = logging.getLogger(__name__)
 
+# Process-wide Docker client, created on first use by get_client()
+_client = None
+_client_lock = threading.Lock()
+
+# Local images by ID, shared by containers running the same image (see get_image())
+_image_cache = {}
+_image_cache_lock = threading.Lock()
+
 
 def filter_environment_variables(container_inspect_data, image_inspect_data, container_name=None):
     """
@@ -202,6 +214,24 @@ def get_client():
     necessary checks for Docker socket availability and permissions. It provides
     detailed error messages and troubleshooting guidance if the connection fails.
 
+    Returns:
+        Docker client instance or None if connection fails
+
+    The client is created once per process and reused by subsequent calls
+    (including calls from worker threads). Failed connection attempts are not
+    cached, so a later call retries.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = _create_client()
+        return _client
+
+
+def _create_client():
+    """
+    Create a new Docker client after checking Docker socket availability and permissions.
+
     Returns:
         Docker client instance or None if connection fails
     """
@@ -226,7 +256,9 @@ def get_client():
         return None
 
     try:
-        return docker.from_env()
+        # Concurrent update workers share this client, so its connection pool must not be
+        # smaller than update.maxWorkers (urllib3 would otherwise discard connections)
+        return docker.from_env(max_pool_size=max(DEFAULT_MAX_POOL_SIZE, config.update.maxWorkers))
     except docker_errors.DockerException as e:
         logging.error(f"Failed to connect to Docker daemon: {e}")
         logging.error("To fix this issue:")
@@ -285,12 +317,18 @@ def get_containers(filters, client):
         logging.debug(f"Found Containers before name filtering: {len(containers)}", extra={"indent": 2})
 
         if name_filters:
+            # Split into exact names and wildcard patterns once; all wildcard patterns are
+            # translated into a single compiled regex that is matched once per container
+            exact_names = {nf for nf in name_filters if "*" not in nf and "?" not in nf}
+            wildcard_patterns = [nf for nf in name_filters if nf not in exact_names]
+            wildcard_regex = (
+                re.compile("|".join(fnmatch.translate(nf) for nf in wildcard_patterns))
+                if wildcard_patterns
+                else None
+            )
 
             def name_matches(cname):
-                return any(
-                    (fnmatch.fnmatch(cname, nf) if any(x in nf for x in ["*", "?"]) else cname == nf)
-                    for nf in name_filters
-                )
+                return cname in exact_names or bool(wildcard_regex and wildcard_regex.match(cname))
 
             containers = [c for c in containers if name_matches(c.name)]
             logging.debug(f"Containers after name filtering: {len(containers)}", extra={"indent": 2})
@@ -302,6 +340,30 @@ def get_containers(filters, client):
     return containers
 
 
+def get_image(client, image_id):
+    """
+    Get a local image object by its ID, reusing images already inspected.
+
+    Multiple containers often run the same image. Image objects are cached by ID
+    so each image is only inspected once. The cache is cleared whenever an image
+    is pulled, because a pull can move tags (RepoTags) between local images.
+
+    Parameters:
+        client: Docker client instance
+        image_id (str): ID of the local image
+
+    Returns:
+        Docker image object
+    """
+    with _image_cache_lock:
+        image = _image_cache.get(image_id)
+    if image is None:
+        image = client.images.get(image_id)
+        with _image_cache_lock:
+            _image_cache[image_id] = image
+    return image
+
+
 def get_local_image_metadata(image, container_inspect_data):
     """
     Extracts registry, repository, tag/digest and full reference from a Docker image object.
@@ -491,6 +553,10 @@ def pull_image(client, image_reference, dry_run):
             if isinstance(event, dict) and event.get("error"):
                 raise docker_errors.APIError(event["error"])
 
+        # Tags may have moved to the pulled image, so cached image data is outdated
+        with _image_cache_lock:
+            _image_cache.clear()
+
         image = client.images.get(image_reference)
         if image:
             logging.debug(f"Successfully pulled image '{image.short_id}'", extra={"indent": 6})
@@ -587,7 +653,7 @@ def get_container_spec(client, container_inspect_data, container_name, image, im
     if image_inspect_data:
         filtered_env = filter_environment_variables(container_inspect_data, image_inspect_data, container_name)
         logging.debug(f"Environment variables: {len(container_env)} total, {len(filtered_env)} preserved", extra={"indent": 6})
-        if filtered_env:
+        if filtered_env and logging.isEnabledFor(DEBUG):
             logging.debug(f"-> Preserved ENVs:\n{json.dumps(filtered_env, indent=4)}", extra={"indent": 6})
     else:
         filtered_env = container_env
@@ -1019,7 +1085,8 @@ def is_self_container(container_name, container_id):
     """
 
     logging.debug("Checking if the given container is the captn application itself", extra={"indent": 6})
-    logging.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 8})
+    if logging.isEnabledFor(DEBUG):
+        logging.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 8})
 
     # Check if we're running inside a container
     if not os.path.exists("/.dockerenv"):
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from .base import NotificationCollector
@@ -16,6 +17,7 @@ class NotificationManager:
     def __init__(self):
         self.collector = NotificationCollector()
         self.notifiers = []
+        self._lock = threading.Lock()  # Containers may be processed concurrently
         self.update_stats = {
             "containers_processed": 0,
             "containers_updated": 0,
@@ -91,28 +93,32 @@ class NotificationManager:
         if error_message:
             detail["error_message"] = error_message
 
-        self.update_stats["update_details"].append(detail)
+        with self._lock:
+            self.update_stats["update_details"].append(detail)
 
-        if status == "succeeded":
-            self.update_stats["containers_updated"] += 1
-        elif status == "failed":
-            self.update_stats["containers_failed"] += 1
+            if status == "succeeded":
+                self.update_stats["containers_updated"] += 1
+            elif status == "failed":
+                self.update_stats["containers_failed"] += 1
 
     def add_warning(self, warning_message: str):
         """Add a warning to the statistics."""
-        self.update_stats["warnings"].append(warning_message)
+        with self._lock:
+            self.update_stats["warnings"].append(warning_message)
 
     def increment_processed(self):
         """Increment the processed containers counter."""
-        self.update_stats["containers_processed"] += 1
+        with self._lock:
+            self.update_stats["containers_processed"] += 1
 
     def add_skip_detail(self, container_name: str, reason: str):
         """Record a skipped container and the reason it was not processed."""
-        self.update_stats["skip_details"].append({
-            "container_name": container_name,
-            "reason": reason,
-        })
-        self.update_stats["containers_skipped"] += 1
+        with self._lock:
+            self.update_stats["skip_details"].append({
+                "container_name": container_name,
+                "reason": reason,
+            })
+            self.update_stats["containers_skipped"] += 1
 
     def set_start_time(self):
         """Set the start time of the update process."""
@@ -2,11 +2,18 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import threading
+import time
 
 from . import docker, ghcr, oci
 
 logger = logging.getLogger(__name__)
 
+# Remote tag lists are cached per image so containers sharing an image only query the registry once
+TAG_CACHE_TTL = 300  # seconds
+_tag_cache = {}
+_tag_cache_lock = threading.Lock()
+
 
 def get_image_tags(imageName, imageUrl, registry, imageTagsUrl, imageTag):
     """
@@ -26,7 +33,18 @@ def get_image_tags(imageName, imageUrl, registry, imageTagsUrl, imageTag):
 
     Returns:
         list: List of available image tags with metadata
+
+    Results are cached for TAG_CACHE_TTL seconds per registry, image and tag, so
+    multiple containers running the same image only cause a single registry lookup.
+    Empty results (e.g. caused by registry errors) are not cached.
     """
+    cache_key = (registry, imageName, imageTagsUrl, imageTag)
+    with _tag_cache_lock:
+        cached = _tag_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < TAG_CACHE_TTL:
+        logger.debug(f"Using cached image tags for '{imageName}:{imageTag}' from '{registry}'", extra={"indent": 2})
+        return list(cached[1])
+
     logger.debug(f"Retrieving available image tags from '{registry}'", extra={"indent": 2})
     if registry in ["docker.io"]:
         tags = docker.get_image_tags(imageTagsUrl, imageTag)
@@ -39,4 +57,8 @@ def get_image_tags(imageName, imageUrl, registry, imageTagsUrl, imageTag):
         f"A total of {len(tags)} image tags relevant for update processing have been retrieved from '{registry}'",
         extra={"indent": 2},
     )
-    return tags
+
+    if tags:
+        with _tag_cache_lock:
+            _tag_cache[cache_key] = (time.monotonic(), tags)
+    return list(tags)
@@ -50,7 +50,8 @@ def get_dockerhub_jwt(repository_name: Optional[str] = None):
     Returns:
         Optional[str]: JWT token if authentication successful, None otherwise
     """
-    logger.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 2})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 2})
     creds = get_credentials(config.docker.apiUrl, repository_name)
     if not creds:
         logger.debug(f"No credentials found for repository: {repository_name}", extra={"indent": 2})
@@ -106,7 +107,8 @@ def get_image_tags(imageTagsUrl, imageTag, max_pages=config.docker.pageCrawlLimi
     tags = []
     page_count = 0
 
-    logger.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 4})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"func_params:\n{json.dumps({k: v for k, v in locals().items()}, indent=4)}", extra={"indent": 4})
 
     # Extract repository name from the URL for auth
     # URL format: https://registry.hub.docker.com/v2/repositories/captnio/captn/tags
@@ -127,6 +129,9 @@ def get_image_tags(imageTagsUrl, imageTag, max_pages=config.docker.pageCrawlLimi
         headers = {}
         logger.debug(f"No authentication configured for Docker Hub (anonymous)", extra={"indent": 2})
 
+    # Filter each page as it arrives so only relevant tags are kept while paginating
+    tag_pattern = generic.generate_tag_regex(imageTag)
+
     while imageTagsUrl:
         check_interrupted()
 
@@ -143,7 +148,7 @@ def get_image_tags(imageTagsUrl, imageTag, max_pages=config.docker.pageCrawlLimi
             data = response.json()
 
             if "results" in data:
-                tags.extend(data["results"])
+                tags.extend(generic.iter_filtered_tags(data["results"], tag_pattern))
 
             imageTagsUrl = data.get("next")
             page_count += 1
@@ -151,11 +156,12 @@ def get_image_tags(imageTagsUrl, imageTag, max_pages=config.docker.pageCrawlLimi
             logger.error(f"Error fetching image tags from {imageTagsUrl}: {e}", extra={"indent": 2})
             break
 
-    logger.debug(f"-> tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
-    tags = generic.filter_image_tags(tags, imageTag)
-    logger.debug(f"-> filtered_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"-> filtered_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
     tags = generic.sort_tags(tags)
-    logger.debug(f"-> sorted_filtered_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"-> sorted_filtered_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
     tags = generic.truncate_tags(tags, imageTag)
-    logger.debug(f"-> truncated_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"-> truncated_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
     return tags
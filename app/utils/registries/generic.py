@@ -77,7 +77,26 @@ def filter_image_tags(tags, imageTag):
     """
     pattern = generate_tag_regex(imageTag)
     logger.debug("Filtering retrieved tags", extra={"indent": 2})
-    return [tag for tag in tags if pattern.match(extract_tag_name(tag))]
+    return list(iter_filtered_tags(tags, pattern))
+
+
+def iter_filtered_tags(tags, pattern):
+    """
+    Lazily yield the tags matching a precompiled tag pattern.
+
+    This allows registries to filter each fetched page right away, so only
+    relevant tags are kept in memory while paginating through large tag lists.
+
+    Parameters:
+        tags (iterable): Tag objects (strings or dicts with 'name' field) to filter
+        pattern (re.Pattern): Pattern as returned by generate_tag_regex()
+
+    Yields:
+        Tag objects whose name matches the pattern
+    """
+    for tag in tags:
+        if pattern.match(extract_tag_name(tag)):
+            yield tag
 
 
 def sort_tags(tags):
@@ -79,7 +79,8 @@ def fetch_ghcr_tag_details(imageUrl: str, tags: List[str], token: str) -> List[D
             manifest = response.json()
             media_type = manifest.get("mediaType")
 
-            logger.debug( f"Raw manifest data for tag {tag}: {json.dumps(manifest, indent=4)}", extra={"indent": 4}, )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug( f"Raw manifest data for tag {tag}: {json.dumps(manifest, indent=4)}", extra={"indent": 4}, )
             header_digest = response.headers.get("Docker-Content-Digest")
 
             # Fallbacks for created
@@ -241,6 +242,9 @@ def get_image_tags(imageName: str, imageUrl: str, imageTagsUrl: str, imageTag: s
             logger.error(f"Failed to retrieve auth token: {e}", extra={"indent": 4})
             return tags
 
+    # Filter each page as it arrives so only relevant tags are kept while paginating
+    tag_pattern = generic.generate_tag_regex(imageTag)
+
     for _ in range(max_pages):
         if not next_url:
             break
@@ -249,7 +253,7 @@ def get_image_tags(imageName: str, imageUrl: str, imageTagsUrl: str, imageTag: s
             response = requests.get(next_url, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
-            tags.extend(data.get("tags", []))
+            tags.extend(generic.iter_filtered_tags(data.get("tags", []), tag_pattern))
 
             # Ensure next page retains page_size
             link_header = response.headers.get("Link", "")
@@ -262,13 +266,15 @@ def get_image_tags(imageName: str, imageUrl: str, imageTagsUrl: str, imageTag: s
             logger.error(f"Error fetching tags from {next_url}: {e}", extra={"indent": 4})
             break
 
-    logger.debug(f"tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 4})
-    filtered_tags = generic.filter_image_tags(tags, imageTag)
-    logger.debug(f"filtered_tags:\n{json.dumps(filtered_tags, indent=4)}", extra={"indent": 4})
-    sorted_tags = generic.sort_tags(filtered_tags)
-    logger.debug(f"sorted_filtered_tags:\n{json.dumps(sorted_tags, indent=4)}", extra={"indent": 4})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"filtered_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 4})
+    sorted_tags = generic.sort_tags(tags)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"sorted_filtered_tags:\n{json.dumps(sorted_tags, indent=4)}", extra={"indent": 4})
     truncated_tags = generic.truncate_tags(sorted_tags, imageTag)
-    logger.debug(f"truncated_tags:\n{json.dumps(truncated_tags, indent=4)}", extra={"indent": 4})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"truncated_tags:\n{json.dumps(truncated_tags, indent=4)}", extra={"indent": 4})
     detailed_tags = fetch_ghcr_tag_details(imageUrl, truncated_tags, token)
-    logger.debug(f"detailed_tags:\n{json.dumps(detailed_tags, indent=4)}", extra={"indent": 4})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"detailed_tags:\n{json.dumps(detailed_tags, indent=4)}", extra={"indent": 4})
     return detailed_tags
@@ -116,6 +116,9 @@ def get_image_tags(
 
     next_url = update_url_with_page_size(imageTagsUrl, page_size)
 
+    # Filter each page as it arrives so only relevant tags are kept while paginating
+    tag_pattern = generic.generate_tag_regex(imageTag)
+
     for _ in range(max_pages):
         if not next_url:
             break
@@ -125,17 +128,18 @@ def get_image_tags(
             response = requests.get(next_url, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
-            tags.extend(data.get("tags", []) or [])
+            tags.extend(generic.iter_filtered_tags(data.get("tags", []) or [], tag_pattern))
             next_url = _parse_next_url(response.headers.get("Link", ""), page_size, registry_api_url)
         except requests.RequestException as e:
             logger.error(f"Error fetching tags from {next_url}: {e}", extra={"indent": 2})
             break
 
-    logger.debug(f"tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
-    filtered_tags = generic.filter_image_tags(tags, imageTag)
-    logger.debug(f"filtered_tags:\n{json.dumps(filtered_tags, indent=4)}", extra={"indent": 2})
-    sorted_tags = generic.sort_tags(filtered_tags)
-    logger.debug(f"sorted_filtered_tags:\n{json.dumps(sorted_tags, indent=4)}", extra={"indent": 2})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"filtered_tags:\n{json.dumps(tags, indent=4)}", extra={"indent": 2})
+    sorted_tags = generic.sort_tags(tags)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"sorted_filtered_tags:\n{json.dumps(sorted_tags, indent=4)}", extra={"indent": 2})
     truncated_tags = generic.truncate_tags(sorted_tags, imageTag)
-    logger.debug(f"truncated_tags:\n{json.dumps(truncated_tags, indent=4)}", extra={"indent": 2})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"truncated_tags:\n{json.dumps(truncated_tags, indent=4)}", extra={"indent": 2})
     return fetch_tag_details(imageUrl, truncated_tags, headers)
@@ -5,6 +5,7 @@ import logging
 import os
 
 from docker.types import Mount
+from app.utils.common import flush_logging
 from app.utils.config import config
 
 
@@ -181,6 +182,8 @@ def execute_self_update_from_helper(client, target_container_name, dry_run):
         # Helper container should exit after completing the update
         if not dry_run:
             logging.info("Self-update helper container exiting", extra={"indent": 0})
+            # os._exit() skips atexit handlers, so queued log records have to be written out first
+            flush_logging()
             # Exit the process to stop the helper container
             os._exit(0)
 